@@ -7,7 +7,7 @@ VENV_DIR="$SKILL_DIR/.venv"
 
 python3 -m venv "$VENV_DIR"
 "$VENV_DIR/bin/python3" -m pip install --upgrade pip
-"$VENV_DIR/bin/python3" -m pip install browser-cookie3 playwright
+"$VENV_DIR/bin/python3" -m pip install browser-cookie3 playwright orjson
 "$VENV_DIR/bin/python3" -m playwright install chromium
 
 echo "prompt-or-die social composer venv ready at $VENV_DIR"
@@ -12,31 +12,119 @@ Provides local equivalents for wrapper-style X endpoints:
 from __future__ import annotations
 
 import argparse
+import atexit
+import contextlib
+import functools
+import itertools
 import json
 import os
 import platform
-import shutil
+import queue
+import re
 import signal
 import subprocess
 import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
-import urllib.request
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+  import orjson  # type: ignore
+except ImportError:
+  orjson = None  # type: ignore[assignment]
+
 
 VALID_BROWSERS = {"chrome", "chromium", "edge"}
-X_HOSTS = ("x.com", "twitter.com")
+_BROWSER_CHOICES = ("chrome", "chromium", "edge")
+X_HOST_SUFFIXES = ("x.com", "twitter.com", ".x.com", ".twitter.com")
+
+# Selector alternatives probed by _visible_first/_click_first. Hoisted to module
+# scope so hot paths do not rebuild identical lists on every call.
+_LOGIN_MARKER_SELECTORS = (
+  "[data-testid='SideNav_NewTweet_Button']",
+  "a[data-testid='AppTabBar_Profile_Link']",
+  "a[href='/home'][aria-label='Home']",
+)
+_LOGIN_MARKER_QUERY = ", ".join(_LOGIN_MARKER_SELECTORS)
+_LOGIN_USER_INPUTS = ("input[name='text']", "input[autocomplete='username']")
+_LOGIN_PASSWORD_INPUTS = ("input[name='password']", "input[type='password']")
+_LOGIN_STEP_QUERY = "input[name='password'], input[type='password'], input[name='text']"
+_COMPOSE_EDITOR_SELECTORS = (
+  "div[contenteditable='true'][data-testid='tweetTextarea_0']",
+  "div[contenteditable='true']",
+  "[data-testid='tweetTextarea_0']",
+)
+_COMPOSE_FILE_INPUTS = ("input[data-testid='fileInput']", "input[type='file']")
+_POST_BUTTON_SELECTORS = (
+  "button[data-testid='tweetButton']",
+  "button[data-testid='tweetButtonInline']",
+  "button:has-text('Post')",
+)
+_LIKE_BUTTON = ("button[data-testid='like']",)
+_UNLIKE_BUTTON = ("button[data-testid='unlike']",)
+_RETWEET_BUTTON = ("button[data-testid='retweet']",)
+_UNRETWEET_BUTTON = ("button[data-testid='unretweet']",)
+_RETWEET_CONFIRM_BUTTONS = ("div[data-testid='retweetConfirm']", "button:has-text('Repost')")
+_TWEET_MENU_BUTTONS = ("button[data-testid='caret']", "button:has-text('More')")
+_DELETE_MENU_ITEMS = ("div[role='menuitem']:has-text('Delete')", "div[role='menuitem']:has-text('Delete post')")
+_DELETE_CONFIRM_BUTTONS = ("button:has-text('Delete')", "div[role='button']:has-text('Delete')")
+_FOLLOW_BUTTON = ("button:has-text('Follow')",)
+_FOLLOW_BUTTONS = ("button:has-text('Follow')", "div[role='button']:has-text('Follow')")
+_FOLLOWING_BUTTONS = ("button:has-text('Following')", "button:has-text('Unfollow')")
+_UNFOLLOW_CONFIRM_BUTTONS = ("button:has-text('Unfollow')", "div[role='button']:has-text('Unfollow')")
+_DM_MESSAGE_BUTTONS = ("button[data-testid='sendDMFromProfile']", "button:has-text('Message')")
+_DM_EDITOR_SELECTORS = ("div[data-testid='dmComposerTextInput'] div[contenteditable='true']", "div[contenteditable='true']")
+_DM_SEND_BUTTONS = ("button[data-testid='dmComposerSendButton']", "button:has-text('Send')")
+_PROFILE_NAME_INPUTS = (
+  "input[name='displayName']",
+  "input[aria-label='Name']",
+  "input[data-testid='Profile_Name_Input']",
+)
+_PROFILE_BIO_INPUTS = (
+  "textarea[name='description']",
+  "textarea[aria-label='Bio']",
+  "textarea[data-testid='Profile_Bio_Input']",
+)
+_PROFILE_SAVE_BUTTONS = (
+  "div[data-testid='Profile_Save_Button']",
+  "button[data-testid='Profile_Save_Button']",
+  "button:has-text('Save')",
+)
+_PROFILE_APPLY_BUTTONS = ("button:has-text('Apply')", "button:has-text('Save')", "div[data-testid='Profile_Save_Button']")
+_SPACE_LISTEN_BUTTONS = (
+  "button:has-text('Start listening')",
+  "button:has-text('Listen live')",
+  "button:has-text('Join this Space')",
+  "button:has-text('Join')",
+)
 
 
 class CliError(Exception):
   """Expected failure with user-actionable message."""
 
 
-@dataclass
+def _dumpsb(obj: Any) -> bytes:
+  """Serialize to UTF-8 JSON bytes (orjson when available, stdlib fallback)."""
+  if orjson is not None:
+    return orjson.dumps(obj)
+  return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps(obj: Any) -> str:
+  return _dumpsb(obj).decode("utf-8")
+
+
+def _loadsb(data: bytes | str) -> Any:
+  if orjson is not None:
+    return orjson.loads(data)
+  return json.loads(data)
+
+
+@dataclass(slots=True, frozen=True)
 class CommandResult:
   ok: bool
   endpoint: str
@@ -59,49 +147,64 @@ def _normalize_handle(value: str | None) -> str:
   return handle[1:] if handle.startswith("@") else handle
 
 
+@functools.lru_cache(maxsize=1)
 def _state_dir() -> Path:
   root = Path(__file__).resolve().parent / ".state"
   root.mkdir(parents=True, exist_ok=True)
   return root
 
 
+@functools.lru_cache(maxsize=1)
 def _stream_pid_file() -> Path:
   return _state_dir() / "x_stream.pid"
 
 
+@functools.lru_cache(maxsize=1)
 def _stream_meta_file() -> Path:
   return _state_dir() / "x_stream.json"
 
 
+@functools.lru_cache(maxsize=1)
 def _stream_log_file() -> Path:
   return _state_dir() / "x_stream.log"
 
 
+@functools.lru_cache(maxsize=1)
 def _session_cookie_file() -> Path:
   return _state_dir() / "x_session_cookies.json"
 
 
+@functools.lru_cache(maxsize=1)
+def _browserd_state_file() -> Path:
+  return _state_dir() / "x_browserd.json"
+
+
+def _project_cookie(item: Any) -> dict[str, Any] | None:
+  """Return the cookie dict when it is a usable X/Twitter cookie, else None."""
+  if not isinstance(item, dict):
+    return None
+  if not str(item.get("domain") or "").endswith(X_HOST_SUFFIXES):
+    return None
+  if not item.get("name") or not item.get("value"):
+    return None
+  return item
+
+
+def _filter_x_cookies(raw: Any) -> list[dict[str, Any]]:
+  if not isinstance(raw, list):
+    return []
+  return [cookie for cookie in map(_project_cookie, raw) if cookie is not None]
+
+
 def _load_saved_session_cookies() -> list[dict[str, Any]]:
   path = _session_cookie_file()
   if not path.exists():
     return []
   try:
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw = _loadsb(path.read_bytes())
   except Exception:
     return []
-  if not isinstance(raw, list):
-    return []
-  cookies: list[dict[str, Any]] = []
-  for item in raw:
-    if not isinstance(item, dict):
-      continue
-    domain = str(item.get("domain") or "")
-    name = str(item.get("name") or "")
-    value = str(item.get("value") or "")
-    if not name or not value or not any(host in domain for host in X_HOSTS):
-      continue
-    cookies.append(item)
-  return cookies
+  return _filter_x_cookies(raw)
 
 
 def _save_session_cookies(context: Any) -> int:
@@ -111,32 +214,23 @@ def _save_session_cookies(context: Any) -> int:
     return 0
   if not isinstance(raw, list):
     return 0
-  out: list[dict[str, Any]] = []
-  for item in raw:
-    if not isinstance(item, dict):
-      continue
-    domain = str(item.get("domain") or "")
-    if not any(host in domain for host in X_HOSTS):
-      continue
-    name = str(item.get("name") or "")
-    value = str(item.get("value") or "")
-    if not name or not value:
-      continue
-    out.append(item)
-  _session_cookie_file().write_text(json.dumps(out, ensure_ascii=False), encoding="utf-8")
+  out = _filter_x_cookies(raw)
+  _session_cookie_file().write_bytes(_dumpsb(out))
   return len(out)
 
 
 def _merge_cookie_sets(primary: list[dict[str, Any]], secondary: list[dict[str, Any]]) -> list[dict[str, Any]]:
   by_key: dict[tuple[str, str, str], dict[str, Any]] = {}
-  # Keep primary values authoritative (fresh browser cookies should override saved session cookies).
-  for src in secondary + primary:
-    domain = str(src.get("domain") or "")
-    name = str(src.get("name") or "")
-    path = str(src.get("path") or "/")
-    if not domain or not name:
-      continue
-    by_key[(domain, name, path)] = src
+  # Keep primary values authoritative (fresh browser cookies should override
+  # saved session cookies) by ingesting it last; iterating the two sources in
+  # place avoids concatenating them into a throwaway list.
+  for source in (secondary, primary):
+    for src in source:
+      domain = src.get("domain") or ""
+      name = src.get("name") or ""
+      if not domain or not name:
+        continue
+      by_key[(domain, name, src.get("path") or "/")] = src
   return list(by_key.values())
 
 
@@ -148,6 +242,14 @@ def _arg_value(args: argparse.Namespace, *names: str) -> str:
   return ""
 
 
+_ECHO_USER_ENDPOINTS = frozenset({"user_login_v3", "refresh_login_v3", "get_my_x_account_detail_v3"})
+_ECHO_TEXT_ENDPOINTS = frozenset({"send_tweet_v3", "create_tweet_v2"})
+_ECHO_TWEET_ID_ENDPOINTS = frozenset(
+  {"like_tweet_v3", "like_tweet_v2", "unlike_tweet_v2", "retweet_v3", "retweet_tweet_v2", "delete_tweet_v2"}
+)
+_ECHO_PROFILE_ENDPOINTS = frozenset({"update_profile_v3", "update_profile_v2"})
+
+
 def _format_aisa_response(
   ok: bool,
   endpoint: str,
@@ -164,27 +266,29 @@ def _format_aisa_response(
       }
     }
 
+  # One sweep over the namespace replaces repeated _arg_value getattr scans.
+  vals = {name: value.strip() for name, value in vars(args).items() if isinstance(value, str) and value.strip()}
   request_echo: dict[str, Any] = {}
-  user_name = _arg_value(args, "user_name", "username")
-  if endpoint in {"user_login_v3", "refresh_login_v3", "get_my_x_account_detail_v3"} and user_name:
+  user_name = vals.get("user_name") or vals.get("username") or ""
+  if endpoint in _ECHO_USER_ENDPOINTS and user_name:
     request_echo["user_name"] = user_name
-  if endpoint in {"send_tweet_v3", "create_tweet_v2"}:
+  if endpoint in _ECHO_TEXT_ENDPOINTS:
     if user_name:
       request_echo["user_name"] = user_name
-    text = _arg_value(args, "text")
+    text = vals.get("text")
     if text:
       request_echo["text"] = text
-  if endpoint in {"like_tweet_v3", "like_tweet_v2", "unlike_tweet_v2", "retweet_v3", "retweet_tweet_v2", "delete_tweet_v2"}:
+  if endpoint in _ECHO_TWEET_ID_ENDPOINTS:
     if user_name:
       request_echo["user_name"] = user_name
-    tweet_id = _arg_value(args, "tweet_id")
+    tweet_id = vals.get("tweet_id")
     if tweet_id:
       request_echo["tweet_id"] = tweet_id
-  if endpoint in {"update_profile_v3", "update_profile_v2"}:
+  if endpoint in _ECHO_PROFILE_ENDPOINTS:
     if user_name:
       request_echo["user_name"] = user_name
-    name = _arg_value(args, "name")
-    bio = _arg_value(args, "bio")
+    name = vals.get("name")
+    bio = vals.get("bio")
     if name:
       request_echo["name"] = name
     if bio:
@@ -201,18 +305,18 @@ def _format_aisa_response(
 
 
 def _render_output(result: CommandResult, args: argparse.Namespace) -> str:
-  compat = getattr(args, "compat_provider", "none")
-  if compat == "aisa":
-    payload = _format_aisa_response(
+  # Default path first: one payload build, one native-serializer call.
+  if getattr(args, "compat_provider", "none") != "aisa":
+    return _dumps(result.to_payload())
+  return _dumps(
+    _format_aisa_response(
       ok=result.ok,
       endpoint=result.endpoint,
       data=result.data,
       error=result.error,
       args=args,
     )
-  else:
-    payload = result.to_payload()
-  return json.dumps(payload, ensure_ascii=False)
+  )
 
 
 def _resolve_cookie_file(
@@ -225,13 +329,18 @@ def _resolve_cookie_file(
   root = Path(chrome_profile).expanduser()
   if root.is_file():
     return str(root)
-  candidates = [
-    root / profile_name / "Cookies",
-    root / "Default" / "Cookies",
-    root / "Cookies",
-  ]
-  for candidate in candidates:
-    if candidate.exists():
+  # One directory read replaces a stat per candidate; only candidates whose
+  # first component exists need a follow-up check.
+  try:
+    with os.scandir(root) as it:
+      entries = {entry.name for entry in it}
+  except OSError as err:
+    raise CliError(f"Could not locate Cookies DB under {root} for browser={browser}.") from err
+  for parts in ((profile_name, "Cookies"), ("Default", "Cookies"), ("Cookies",)):
+    if parts[0] not in entries:
+      continue
+    candidate = root.joinpath(*parts)
+    if len(parts) == 1 or candidate.exists():
       return str(candidate)
   raise CliError(f"Could not locate Cookies DB under {root} for browser={browser}.")
 
@@ -267,7 +376,7 @@ def _load_x_cookies(
   cookies: list[dict[str, Any]] = []
   for cookie in jar:
     domain = getattr(cookie, "domain", "") or ""
-    if not any(host in domain for host in X_HOSTS):
+    if not domain.endswith(X_HOST_SUFFIXES):
       continue
     name = getattr(cookie, "name", "") or ""
     value = getattr(cookie, "value", "") or ""
@@ -291,40 +400,152 @@ def _load_x_cookies(
   return cookies
 
 
+_WEBHOOK_SCHEMES = frozenset({"http", "https"})
+_WEBHOOK_CONNS: dict[tuple[str, str, int], http.client.HTTPConnection] = {}
+_WEBHOOK_LOCK = threading.Lock()
+
+
+def _webhook_connection(scheme: str, host: str, port: int) -> http.client.HTTPConnection:
+  import http.client
+
+  key = (scheme, host, port)
+  conn = _WEBHOOK_CONNS.get(key)
+  if conn is None:
+    if scheme == "https":
+      conn = http.client.HTTPSConnection(host, port, timeout=10)
+    else:
+      conn = http.client.HTTPConnection(host, port, timeout=10)
+    _WEBHOOK_CONNS[key] = conn
+  return conn
+
+
 def _send_webhook_notification(webhook_url: str, payload: dict[str, Any]) -> None:
-  req = urllib.request.Request(
-    webhook_url,
-    data=json.dumps(payload).encode("utf-8"),
-    headers={"Content-Type": "application/json"},
-    method="POST",
+  parts = urllib.parse.urlsplit(webhook_url)
+  if parts.scheme not in _WEBHOOK_SCHEMES or not parts.hostname:
+    raise CliError(f"Unsupported webhook URL: {webhook_url}")
+  port = parts.port or (443 if parts.scheme == "https" else 80)
+  path = parts.path or "/"
+  if parts.query:
+    path = f"{path}?{parts.query}"
+  import http.client
+
+  body = _dumpsb(payload)
+  headers = {"Content-Type": "application/json"}
+  with _WEBHOOK_LOCK:
+    for attempt in (0, 1):
+      conn = _webhook_connection(parts.scheme, parts.hostname, port)
+      try:
+        conn.request("POST", path, body=body, headers=headers)
+        conn.getresponse().read()
+        return
+      except (http.client.HTTPException, OSError):
+        # Stale keep-alive socket; drop it and retry once on a fresh one.
+        _WEBHOOK_CONNS.pop((parts.scheme, parts.hostname, port), None)
+        try:
+          conn.close()
+        except Exception:
+          pass
+        if attempt:
+          raise
+
+
+_WEBHOOK_QUEUE: queue.Queue = queue.Queue()
+_WEBHOOK_WORKER: threading.Thread | None = None
+
+
+def _webhook_worker() -> None:
+  while True:
+    item = _WEBHOOK_QUEUE.get()
+    if item is None:
+      _WEBHOOK_QUEUE.task_done()
+      return
+    url, payload = item
+    try:
+      _send_webhook_notification(url, payload)
+    except Exception:
+      pass
+    _WEBHOOK_QUEUE.task_done()
+
+
+def _drain_webhook_queue(timeout: float = 2.0) -> None:
+  """Give in-flight webhook posts a bounded window to finish at exit."""
+  _WEBHOOK_QUEUE.put(None)
+  deadline = time.monotonic() + timeout
+  while _WEBHOOK_QUEUE.unfinished_tasks and time.monotonic() < deadline:
+    time.sleep(0.05)
+
+
+def _enqueue_webhook(webhook_url: str, payload: dict[str, Any]) -> None:
+  """Hand the POST to a daemon worker so command latency excludes webhook RTT."""
+  global _WEBHOOK_WORKER
+  if _WEBHOOK_WORKER is None:
+    _WEBHOOK_WORKER = threading.Thread(target=_webhook_worker, daemon=True)
+    _WEBHOOK_WORKER.start()
+    atexit.register(_drain_webhook_queue)
+  _WEBHOOK_QUEUE.put((webhook_url, payload))
+
+
+def _spawn_detached(cmd: list[str]) -> None:
+  """Launch a notifier without waiting; the exit status is never consulted."""
+  subprocess.Popen(
+    cmd,
+    stdout=subprocess.DEVNULL,
+    stderr=subprocess.DEVNULL,
+    start_new_session=True,
   )
-  with urllib.request.urlopen(req, timeout=10):
-    return
+
+
+def _notify_macos(title: str, message: str) -> None:
+  _spawn_detached(["osascript", "-e", f'display notification "{message}" with title "{title}"'])
+
+
+def _notify_linux(title: str, message: str) -> None:
+  _spawn_detached(["notify-send", title, message])
+
+
+_WINDOWS_TOAST_PS_TEMPLATE = (
+  "[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] > $null;"
+  "$xml = New-Object Windows.Data.Xml.Dom.XmlDocument;"
+  '$xml.LoadXml("<toast><visual><binding template=\\"ToastGeneric\\"><text>'
+  "{title}</text><text>{message}</text></binding></visual></toast>\");"
+  "$toast = [Windows.UI.Notifications.ToastNotification]::new($xml);"
+  '$notifier = [Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("PromptOrDie");'
+  "$notifier.Show($toast);"
+)
+
+
+def _notify_windows(title: str, message: str) -> None:
+  _spawn_detached(["powershell", "-Command", _WINDOWS_TOAST_PS_TEMPLATE.format(title=title, message=message)])
+
+
+# The platform cannot change mid-process, so resolve the backend once at import
+# instead of re-dispatching on platform.system() per notification.
+_NOTIFY_IMPL = {
+  "darwin": _notify_macos,
+  "linux": _notify_linux,
+  "windows": _notify_windows,
+}.get(platform.system().lower())
 
 
 def _send_local_notification(title: str, message: str) -> None:
-  system = platform.system().lower()
-  if system == "darwin":
-    script = f'display notification "{message}" with title "{title}"'
-    subprocess.run(["osascript", "-e", script], check=False)
-    return
-  if system == "linux":
-    subprocess.run(["notify-send", title, message], check=False)
+  if _NOTIFY_IMPL is not None:
+    _NOTIFY_IMPL(title, message)
+
+
+_NOTIFY_QUEUE: list[dict[str, Any]] = []
+_NOTIFY_QUEUE_URL: str | None = None
+
+
+def _flush_notify_queue() -> None:
+  """Deliver all queued webhook events in one POST at interpreter exit."""
+  if not _NOTIFY_QUEUE or not _NOTIFY_QUEUE_URL:
     return
-  if system == "windows":
-    ps = (
-      "[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] > $null;"
-      "$xml = New-Object Windows.Data.Xml.Dom.XmlDocument;"
-      '$xml.LoadXml("<toast><visual><binding template=\\"ToastGeneric\\"><text>'
-      + title
-      + "</text><text>"
-      + message
-      + "</text></binding></visual></toast>\");"
-      "$toast = [Windows.UI.Notifications.ToastNotification]::new($xml);"
-      '$notifier = [Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("PromptOrDie");'
-      "$notifier.Show($toast);"
-    )
-    subprocess.run(["powershell", "-Command", ps], check=False)
+  payload = {"source": "prompt-or-die-social-composer", "events": list(_NOTIFY_QUEUE)}
+  _NOTIFY_QUEUE.clear()
+  try:
+    _send_webhook_notification(_NOTIFY_QUEUE_URL, payload)
+  except Exception:
+    pass
 
 
 def _notify(args: argparse.Namespace, ok: bool, endpoint: str, detail: str) -> None:
@@ -344,24 +565,85 @@ def _notify(args: argparse.Namespace, ok: bool, endpoint: str, detail: str) -> N
       "detail": detail,
       "status": status,
     }
-    try:
-      _send_webhook_notification(args.notify_webhook, payload)
-    except Exception:
-      pass
+    if getattr(args, "notify_batch", False):
+      global _NOTIFY_QUEUE_URL
+      if _NOTIFY_QUEUE_URL is None:
+        _NOTIFY_QUEUE_URL = args.notify_webhook
+        atexit.register(_flush_notify_queue)
+      _NOTIFY_QUEUE.append({k: v for k, v in payload.items() if k != "source"})
+      return
+    _enqueue_webhook(args.notify_webhook, payload)
+
+
+_FIND_FIRST_VISIBLE_JS = """
+(selectors) => {
+  const unsupported = [];
+  for (let i = 0; i < selectors.length; i++) {
+    let el = null;
+    try {
+      el = document.querySelector(selectors[i]);
+    } catch (err) {
+      // Playwright-only syntax (e.g. :has-text) is invalid for querySelector.
+      unsupported.push(i);
+      continue;
+    }
+    if (el && el.getClientRects().length > 0) return { matched: i, unsupported };
+  }
+  return { matched: null, unsupported };
+}
+"""
+
+
+@functools.lru_cache(maxsize=512)
+def _joined_selector(selectors: tuple[str, ...], visible_only: bool = False) -> str:
+  if visible_only:
+    return ", ".join(f"{s}:visible" for s in selectors)
+  return ", ".join(selectors)
+
+
+_LOCATOR_CACHE: dict[tuple[int, str], Any] = {}
+
 
+def _cached_locator(page: Any, joined: str) -> Any:
+  """Reuse Locator handles per page so repeated probes skip re-parsing."""
+  key = (id(page), joined)
+  locator = _LOCATOR_CACHE.get(key)
+  if locator is None:
+    if len(_LOCATOR_CACHE) >= 512:
+      _LOCATOR_CACHE.clear()
+    locator = _LOCATOR_CACHE[key] = page.locator(joined)
+  return locator
 
-def _visible_first(page: Any, selectors: list[str]) -> Any:
-  for selector in selectors:
-    locator = page.locator(selector)
+
+def _visible_first(page: Any, selectors: tuple[str, ...]) -> Any:
+  # Probe all CSS-resolvable selectors in one page.evaluate round trip. The
+  # probe's hit only wins outright when no Playwright-only selector ranks
+  # ahead of it; earlier ones are re-checked first so the tuple's priority
+  # order is preserved (e.g. an Apply button listed before a background Save).
+  try:
+    probe = page.evaluate(_FIND_FIRST_VISIBLE_JS, list(selectors))
+  except Exception:
+    probe = None
+  if isinstance(probe, dict):
+    matched = probe.get("matched")
+    unsupported = probe.get("unsupported") or []
+    pending = tuple(i for i in unsupported if matched is None or i < matched)
+  else:
+    matched = None
+    pending = tuple(range(len(selectors)))
+  for index in pending:
+    locator = page.locator(selectors[index]).first
     try:
-      if locator.count() > 0 and locator.first.is_visible():
-        return locator.first
+      if locator.is_visible():
+        return locator
     except Exception:
       continue
+  if matched is not None:
+    return page.locator(selectors[matched]).first
   return None
 
 
-def _click_first(page: Any, selectors: list[str]) -> bool:
+def _click_first(page: Any, selectors: tuple[str, ...]) -> bool:
   element = _visible_first(page, selectors)
   if not element:
     return False
@@ -374,19 +656,315 @@ def _click_first(page: Any, selectors: list[str]) -> bool:
   return False
 
 
-def _extract_handle_from_nav(page: Any) -> str | None:
-  script = """
-() => {
-  const profileLink = document.querySelector("a[data-testid='AppTabBar_Profile_Link']");
-  if (!profileLink) return null;
-  const href = profileLink.getAttribute("href") || "";
-  if (!href.startsWith("/")) return null;
-  const handle = href.slice(1).split("/")[0];
-  return handle || null;
-}
+def _wait_any(page: Any, selectors: tuple[str, ...], timeout: int = 5000) -> bool:
+  """Block until any of the selectors is visible; False on timeout."""
+  try:
+    _cached_locator(page, _joined_selector(selectors)).first.wait_for(state="visible", timeout=timeout)
+    return True
+  except Exception:
+    return False
+
+
+def _wait_gone(page: Any, selectors: tuple[str, ...], timeout: int = 5000) -> bool:
+  """Block until none of the selectors is visible; False on timeout."""
+  try:
+    _cached_locator(page, _joined_selector(selectors)).first.wait_for(state="hidden", timeout=timeout)
+    return True
+  except Exception:
+    return False
+
+
+_SAFE_QUERY_RE = re.compile(r"^[A-Za-z0-9_.~-]+$")
+
+
+def _qenc(value: str) -> str:
+  """Percent-encode a query term, skipping quote() when nothing needs it."""
+  if _SAFE_QUERY_RE.match(value):
+    return value
+  return urllib.parse.quote(value)
+
+
+_TWEET_CELL = ("article[data-testid='tweet']",)
+_LIST_CELLS = ("[data-testid='cellInnerDiv']",)
+_PRIMARY_COLUMN = ("div[data-testid='primaryColumn']",)
+_TREND_CELLS = ("[data-testid='trend']", "[data-testid='cellInnerDiv']")
+
+
+def _goto_ready(page: Any, url: str, ready_selectors: tuple[str, ...], timeout: int = 8000) -> None:
+  """Navigate and block on a real content signal instead of a fixed sleep.
+
+  On an SPA, domcontentloaded fires before any content is requested, so
+  commit plus an explicit selector wait is faster on warm loads and sturdier
+  on slow ones. Timeouts fall through; callers extract what has rendered.
+  """
+  page.goto(url, wait_until="commit")
+  _wait_any(page, ready_selectors, timeout=timeout)
+
+
+def _as_dicts(raw: Any) -> list[dict[str, Any]]:
+  """Normalize a page.evaluate result to a list of dict rows.
+
+  The JS extractors emit homogeneous object arrays, so sampling the head is
+  enough for the common path; the per-row isinstance sweep only runs when the
+  payload is malformed.
+  """
+  if type(raw) is not list:
+    return []
+  if not raw or type(raw[0]) is dict:
+    return raw
+  return [row for row in raw if isinstance(row, dict)]
+
+
+# The DOM extractors are installed once per context via add_init_script as
+# window.__xlocal, so every page -- including pool tabs opened later -- has
+# them ready and each _extract_* call sends a tiny invocation string over CDP
+# instead of shipping (and re-parsing) the full extractor source per call.
+_XLOCAL_INIT_JS = """
+(() => {
+  if (window.__xlocal) return;
+  const STATUS_RE = /status\\/(\\d+)/;
+  const SPACE_RE = /\\/i\\/spaces\\/([a-zA-Z0-9]+)/;
+  window.__xlocal = {
+    seen: new Set(),
+
+    // With track=true an extractor only returns rows it has not produced
+    // before on this page, so scroll loops receive deltas instead of the
+    // whole visible DOM on every step.
+    fresh(rows, track) {
+      if (!track) return rows;
+      const out = [];
+      for (const row of rows) {
+        if (!row.key || this.seen.has(row.key)) continue;
+        this.seen.add(row.key);
+        out.push(row);
+      }
+      return out;
+    },
+
+    navHandle() {
+      const profileLink = document.querySelector("a[data-testid='AppTabBar_Profile_Link']");
+      if (!profileLink) return null;
+      const href = profileLink.getAttribute("href") || "";
+      if (!href.startsWith("/")) return null;
+      const handle = href.slice(1).split("/")[0];
+      return handle || null;
+    },
+
+    profile() {
+      const nameEl = document.querySelector("[data-testid='UserName'] span");
+      const bioEl = document.querySelector("[data-testid='UserDescription']");
+      const followersEl = document.querySelector("a[href*='/verified_followers'] span");
+      const followingEl = document.querySelector("a[href*='/following'] span");
+      return {
+        display_name: nameEl?.textContent?.trim() || null,
+        bio: bioEl?.textContent?.trim() || "",
+        followers: followersEl?.textContent?.trim() || null,
+        following: followingEl?.textContent?.trim() || null
+      };
+    },
+
+    tweets(track) {
+      const out = [];
+      const cards = document.querySelectorAll("article[data-testid='tweet']");
+      cards.forEach((card, idx) => {
+        const link = card.querySelector("a[href*='/status/']");
+        const href = link?.getAttribute("href") || "";
+        const match = STATUS_RE.exec(href);
+        const tweetId = match ? match[1] : null;
+        const text = card.querySelector("[data-testid='tweetText']")?.innerText?.trim() || "";
+        const userLink = card.querySelector("div[data-testid='User-Name'] a[href^='/']");
+        const authorHref = userLink?.getAttribute("href") || "";
+        const author = authorHref.startsWith("/") ? authorHref.slice(1).split("/")[0] : null;
+        const time = card.querySelector("time")?.getAttribute("datetime") || null;
+        const socialContext = card.querySelector("[data-testid='socialContext']")?.innerText?.trim() || "";
+        const imageUrls = Array.from(card.querySelectorAll("img"))
+          .map((img) => (img.getAttribute("src") || "").trim())
+          .filter((src) => src.includes("twimg.com/media"));
+        const videoPosters = Array.from(card.querySelectorAll("video"))
+          .map((video) => (video.getAttribute("poster") || "").trim())
+          .filter(Boolean);
+        const mediaUrls = Array.from(new Set([...imageUrls, ...videoPosters]));
+        const hasVideo = card.querySelectorAll("video").length > 0;
+        const mediaCount = mediaUrls.length + (hasVideo ? 1 : 0);
+        const isRepostHint =
+          socialContext.toLowerCase().includes("reposted") ||
+          socialContext.toLowerCase().includes("retweeted");
+        out.push({
+          key: tweetId || href || `idx-${idx}`,
+          tweet_id: tweetId,
+          text,
+          author,
+          url: href ? `https://x.com${href}` : null,
+          timestamp: time,
+          social_context: socialContext || null,
+          image_urls: imageUrls,
+          media_urls: mediaUrls,
+          has_video: hasVideo,
+          has_media: mediaCount > 0,
+          media_count: mediaCount,
+          is_repost_hint: isRepostHint
+        });
+      });
+      return this.fresh(out, track);
+    },
+
+    notifications(track) {
+      const out = [];
+      const seen = new Set();
+      const push = (row) => {
+        if (!row.key || seen.has(row.key)) return;
+        seen.add(row.key);
+        out.push(row);
+      };
+
+      const nodes = document.querySelectorAll("article[data-testid='tweet'], div[data-testid='cellInnerDiv']");
+      let tweetIdx = 0;
+      let cardIdx = 0;
+      nodes.forEach((node) => {
+        if (node.matches("article[data-testid='tweet']")) {
+          const idx = tweetIdx++;
+          const text = node.querySelector("[data-testid='tweetText']")?.innerText?.trim() || "";
+          const link = node.querySelector("a[href*='/status/']");
+          const href = link?.getAttribute("href") || "";
+          const match = STATUS_RE.exec(href);
+          const tweetId = match ? match[1] : null;
+          const actorLink = node.querySelector("div[data-testid='User-Name'] a[href^='/']");
+          const actorHref = actorLink?.getAttribute("href") || "";
+          const actor = actorHref.startsWith("/") ? actorHref.slice(1).split("/")[0] : null;
+          const socialContext = node.querySelector("[data-testid='socialContext']")?.innerText?.trim() || "";
+          const time = node.querySelector("time")?.getAttribute("datetime") || null;
+          push({
+            key: tweetId || href || `tweet-${idx}`,
+            type: "tweet",
+            actor,
+            social_context: socialContext || null,
+            tweet_id: tweetId,
+            text,
+            url: href ? `https://x.com${href}` : null,
+            timestamp: time,
+          });
+          return;
+        }
+        const idx = cardIdx++;
+        const text = (node.innerText || "").replace(/\\s+/g, " ").trim();
+        if (!text) return;
+        const link = node.querySelector("a[href^='/']");
+        const href = link?.getAttribute("href") || "";
+        const actor = href.startsWith("/") ? href.slice(1).split("/")[0] : null;
+        push({
+          key: `card-${idx}-${href || text.slice(0, 24)}`,
+          type: "notification_card",
+          actor,
+          text: text.slice(0, 500),
+          url: href ? `https://x.com${href}` : null,
+          timestamp: null,
+        });
+      });
+
+      return this.fresh(out, track);
+    },
+
+    users(track) {
+      const out = [];
+      const cards = document.querySelectorAll("div[data-testid='UserCell']");
+      cards.forEach((card, idx) => {
+        const links = Array.from(card.querySelectorAll("a[href^='/']"));
+        let handle = null;
+        for (const link of links) {
+          const href = link.getAttribute("href") || "";
+          if (!href || href.startsWith("/i/")) continue;
+          const candidate = href.slice(1).split("/")[0];
+          if (candidate && !candidate.includes("?")) {
+            handle = candidate;
+            break;
+          }
+        }
+        const display = card.querySelector("div[dir='ltr'] span")?.textContent?.trim() || null;
+        const bio = card.querySelector("[data-testid='UserDescription']")?.innerText?.trim() || "";
+        out.push({
+          key: handle || `idx-${idx}`,
+          handle,
+          display_name: display,
+          bio
+        });
+      });
+      return this.fresh(out, track);
+    },
+
+    trends(track) {
+      const rows = [];
+      const trendNodes = Array.from(document.querySelectorAll("div[data-testid='trend']"));
+      trendNodes.forEach((node, idx) => {
+        const lines = (node.innerText || "")
+          .split("\\n")
+          .map((v) => v.trim())
+          .filter(Boolean);
+        const topic = lines.find((x) => x.startsWith("#")) || lines[lines.length - 1] || null;
+        rows.push({
+          key: topic || `idx-${idx}`,
+          rank: idx + 1,
+          topic,
+          lines
+        });
+      });
+      return this.fresh(rows, track);
+    },
+
+    spaces(track) {
+      const out = [];
+      const anchors = Array.from(document.querySelectorAll("a[href*='/i/spaces/']"));
+      const seen = new Set();
+      anchors.forEach((a, idx) => {
+        const href = a.getAttribute("href") || "";
+        const m = SPACE_RE.exec(href);
+        if (!m) return;
+        const spaceId = m[1];
+        if (seen.has(spaceId)) return;
+        seen.add(spaceId);
+        const card = a.closest("article,div");
+        const text = (card?.innerText || a.innerText || "").split("\\n").map(v => v.trim()).filter(Boolean);
+        out.push({
+          key: spaceId,
+          space_id: spaceId,
+          url: `https://x.com/i/spaces/${spaceId}`,
+          lines: text.slice(0, 8),
+          title: text[0] || null
+        });
+      });
+      return this.fresh(out, track);
+    },
+
+    spaceDetail() {
+      const ogTitle = document.querySelector("meta[property='og:title']")?.getAttribute("content") || null;
+      const ogDesc = document.querySelector("meta[property='og:description']")?.getAttribute("content") || null;
+      const titleNode = document.querySelector("h1, h2");
+      const title = titleNode?.textContent?.trim() || ogTitle;
+      const body = (document.body?.innerText || "").split("\\n").map(v => v.trim()).filter(Boolean);
+      return {
+        title,
+        description: ogDesc,
+        lines: body.slice(0, 30)
+      };
+    }
+  };
+})();
 """
+
+
+def _evaluate_extractor(page: Any, call: str) -> Any:
+  expression = f"() => window.__xlocal.{call}"
+  try:
+    return page.evaluate(expression)
+  except Exception:
+    # The page predates the init script (or a navigation raced it); install
+    # the bundle inline and retry once.
+    page.evaluate(_XLOCAL_INIT_JS)
+    return page.evaluate(expression)
+
+
+def _extract_handle_from_nav(page: Any) -> str | None:
   try:
-    result = page.evaluate(script)
+    result = _evaluate_extractor(page, "navHandle()")
   except Exception:
     return None
   if isinstance(result, str) and result.strip():
@@ -395,21 +973,7 @@ def _extract_handle_from_nav(page: Any) -> str | None:
 
 
 def _extract_profile_summary(page: Any, handle: str) -> dict[str, Any]:
-  script = """
-() => {
-  const nameEl = document.querySelector("[data-testid='UserName'] span");
-  const bioEl = document.querySelector("[data-testid='UserDescription']");
-  const followersEl = document.querySelector("a[href*='/verified_followers'] span");
-  const followingEl = document.querySelector("a[href*='/following'] span");
-  return {
-    display_name: nameEl?.textContent?.trim() || null,
-    bio: bioEl?.textContent?.trim() || "",
-    followers: followersEl?.textContent?.trim() || null,
-    following: followingEl?.textContent?.trim() || null
-  };
-}
-"""
-  raw = page.evaluate(script)
+  raw = _evaluate_extractor(page, "profile()")
   if not isinstance(raw, dict):
     raw = {}
   return {
@@ -422,233 +986,32 @@ def _extract_profile_summary(page: Any, handle: str) -> dict[str, Any]:
   }
 
 
-def _extract_tweets(page: Any) -> list[dict[str, Any]]:
-  script = """
-() => {
-  const out = [];
-  const cards = document.querySelectorAll("article[data-testid='tweet']");
-  cards.forEach((card, idx) => {
-    const link = card.querySelector("a[href*='/status/']");
-    const href = link?.getAttribute("href") || "";
-    const match = href.match(/status\\/(\\d+)/);
-    const tweetId = match ? match[1] : null;
-    const text = card.querySelector("[data-testid='tweetText']")?.innerText?.trim() || "";
-    const userLink = card.querySelector("div[data-testid='User-Name'] a[href^='/']");
-    const authorHref = userLink?.getAttribute("href") || "";
-    const author = authorHref.startsWith("/") ? authorHref.slice(1).split("/")[0] : null;
-    const time = card.querySelector("time")?.getAttribute("datetime") || null;
-    const socialContext = card.querySelector("[data-testid='socialContext']")?.innerText?.trim() || "";
-    const imageUrls = Array.from(card.querySelectorAll("img"))
-      .map((img) => (img.getAttribute("src") || "").trim())
-      .filter((src) => src.includes("twimg.com/media"));
-    const videoPosters = Array.from(card.querySelectorAll("video"))
-      .map((video) => (video.getAttribute("poster") || "").trim())
-      .filter(Boolean);
-    const mediaUrls = Array.from(new Set([...imageUrls, ...videoPosters]));
-    const hasVideo = card.querySelectorAll("video").length > 0;
-    const mediaCount = mediaUrls.length + (hasVideo ? 1 : 0);
-    const isRepostHint =
-      socialContext.toLowerCase().includes("reposted") ||
-      socialContext.toLowerCase().includes("retweeted");
-    out.push({
-      key: tweetId || href || `idx-${idx}`,
-      tweet_id: tweetId,
-      text,
-      author,
-      url: href ? `https://x.com${href}` : null,
-      timestamp: time,
-      social_context: socialContext || null,
-      image_urls: imageUrls,
-      media_urls: mediaUrls,
-      has_video: hasVideo,
-      has_media: mediaCount > 0,
-      media_count: mediaCount,
-      is_repost_hint: isRepostHint
-    });
-  });
-  return out;
-}
-"""
-  raw = page.evaluate(script)
-  if not isinstance(raw, list):
-    return []
-  return [row for row in raw if isinstance(row, dict)]
+def _extract_rows(page: Any, name: str, incremental: bool) -> list[dict[str, Any]]:
+  return _as_dicts(_evaluate_extractor(page, f"{name}(true)" if incremental else f"{name}()"))
 
 
-def _extract_notifications(page: Any) -> list[dict[str, Any]]:
-  script = """
-() => {
-  const out = [];
-
-  const tweets = Array.from(document.querySelectorAll("article[data-testid='tweet']"));
-  tweets.forEach((card, idx) => {
-    const text = card.querySelector("[data-testid='tweetText']")?.innerText?.trim() || "";
-    const link = card.querySelector("a[href*='/status/']");
-    const href = link?.getAttribute("href") || "";
-    const match = href.match(/status\\/(\\d+)/);
-    const tweetId = match ? match[1] : null;
-    const actorLink = card.querySelector("div[data-testid='User-Name'] a[href^='/']");
-    const actorHref = actorLink?.getAttribute("href") || "";
-    const actor = actorHref.startsWith("/") ? actorHref.slice(1).split("/")[0] : null;
-    const socialContext = card.querySelector("[data-testid='socialContext']")?.innerText?.trim() || "";
-    const time = card.querySelector("time")?.getAttribute("datetime") || null;
-    out.push({
-      key: tweetId || href || `tweet-${idx}`,
-      type: "tweet",
-      actor,
-      social_context: socialContext || null,
-      tweet_id: tweetId,
-      text,
-      url: href ? `https://x.com${href}` : null,
-      timestamp: time,
-    });
-  });
-
-  const cards = Array.from(document.querySelectorAll("div[data-testid='cellInnerDiv']"));
-  cards.forEach((node, idx) => {
-    const text = (node.innerText || "").replace(/\\s+/g, " ").trim();
-    if (!text) return;
-    const link = node.querySelector("a[href^='/']");
-    const href = link?.getAttribute("href") || "";
-    const actor = href.startsWith("/") ? href.slice(1).split("/")[0] : null;
-    out.push({
-      key: `card-${idx}-${href || text.slice(0, 24)}`,
-      type: "notification_card",
-      actor,
-      text: text.slice(0, 500),
-      url: href ? `https://x.com${href}` : null,
-      timestamp: null,
-    });
-  });
-
-  return out;
-}
-"""
-  raw = page.evaluate(script)
-  if not isinstance(raw, list):
-    return []
-  unique: dict[str, dict[str, Any]] = {}
-  for row in raw:
-    if not isinstance(row, dict):
-      continue
-    key = str(row.get("key") or "")
-    if not key:
-      continue
-    if key not in unique:
-      unique[key] = row
-  return list(unique.values())
-
-
-def _extract_users(page: Any) -> list[dict[str, Any]]:
-  script = """
-() => {
-  const out = [];
-  const cards = document.querySelectorAll("div[data-testid='UserCell']");
-  cards.forEach((card, idx) => {
-    const links = Array.from(card.querySelectorAll("a[href^='/']"));
-    let handle = null;
-    for (const link of links) {
-      const href = link.getAttribute("href") || "";
-      if (!href || href.startsWith("/i/")) continue;
-      const candidate = href.slice(1).split("/")[0];
-      if (candidate && !candidate.includes("?")) {
-        handle = candidate;
-        break;
-      }
-    }
-    const display = card.querySelector("div[dir='ltr'] span")?.textContent?.trim() || null;
-    const bio = card.querySelector("[data-testid='UserDescription']")?.innerText?.trim() || "";
-    out.push({
-      key: handle || `idx-${idx}`,
-      handle,
-      display_name: display,
-      bio
-    });
-  });
-  return out;
-}
-"""
-  raw = page.evaluate(script)
-  if not isinstance(raw, list):
-    return []
-  return [row for row in raw if isinstance(row, dict)]
+def _extract_tweets(page: Any, incremental: bool = False) -> list[dict[str, Any]]:
+  return _extract_rows(page, "tweets", incremental)
 
 
-def _extract_trends(page: Any) -> list[dict[str, Any]]:
-  script = """
-() => {
-  const rows = [];
-  const trendNodes = Array.from(document.querySelectorAll("div[data-testid='trend']"));
-  trendNodes.forEach((node, idx) => {
-    const lines = (node.innerText || "")
-      .split("\\n")
-      .map((v) => v.trim())
-      .filter(Boolean);
-    const topic = lines.find((x) => x.startsWith("#")) || lines[lines.length - 1] || null;
-    rows.push({
-      key: topic || `idx-${idx}`,
-      rank: idx + 1,
-      topic,
-      lines
-    });
-  });
-  return rows;
-}
-"""
-  raw = page.evaluate(script)
-  if not isinstance(raw, list):
-    return []
-  return [row for row in raw if isinstance(row, dict)]
+def _extract_notifications(page: Any, incremental: bool = False) -> list[dict[str, Any]]:
+  return _extract_rows(page, "notifications", incremental)
 
 
-def _extract_spaces(page: Any) -> list[dict[str, Any]]:
-  script = """
-() => {
-  const out = [];
-  const anchors = Array.from(document.querySelectorAll("a[href*='/i/spaces/']"));
-  const seen = new Set();
-  anchors.forEach((a, idx) => {
-    const href = a.getAttribute("href") || "";
-    const m = href.match(/\\/i\\/spaces\\/([a-zA-Z0-9]+)/);
-    if (!m) return;
-    const spaceId = m[1];
-    if (seen.has(spaceId)) return;
-    seen.add(spaceId);
-    const card = a.closest("article,div");
-    const text = (card?.innerText || a.innerText || "").split("\\n").map(v => v.trim()).filter(Boolean);
-    out.push({
-      key: spaceId,
-      space_id: spaceId,
-      url: `https://x.com/i/spaces/${spaceId}`,
-      lines: text.slice(0, 8),
-      title: text[0] || null
-    });
-  });
-  return out;
-}
-"""
-  raw = page.evaluate(script)
-  if not isinstance(raw, list):
-    return []
-  return [row for row in raw if isinstance(row, dict)]
+def _extract_users(page: Any, incremental: bool = False) -> list[dict[str, Any]]:
+  return _extract_rows(page, "users", incremental)
+
+
+def _extract_trends(page: Any, incremental: bool = False) -> list[dict[str, Any]]:
+  return _extract_rows(page, "trends", incremental)
+
+
+def _extract_spaces(page: Any, incremental: bool = False) -> list[dict[str, Any]]:
+  return _extract_rows(page, "spaces", incremental)
 
 
 def _extract_space_detail(page: Any, space_id: str) -> dict[str, Any]:
-  script = """
-() => {
-  const ogTitle = document.querySelector("meta[property='og:title']")?.getAttribute("content") || null;
-  const ogDesc = document.querySelector("meta[property='og:description']")?.getAttribute("content") || null;
-  const titleNode = document.querySelector("h1, h2");
-  const title = titleNode?.textContent?.trim() || ogTitle;
-  const body = (document.body?.innerText || "").split("\\n").map(v => v.trim()).filter(Boolean);
-  return {
-    title,
-    description: ogDesc,
-    lines: body.slice(0, 30)
-  };
-}
-"""
-  raw = page.evaluate(script)
+  raw = _evaluate_extractor(page, "spaceDetail()")
   if not isinstance(raw, dict):
     raw = {}
   return {
@@ -667,20 +1030,19 @@ def _collect_with_scroll(
   max_scrolls: int = 14,
   pause_ms: int = 750,
 ) -> list[dict[str, Any]]:
-  seen: dict[str, dict[str, Any]] = {}
+  # The extractor tracks already-returned keys in-page, so each step only
+  # transfers new rows and Python just accumulates them.
+  collected: list[dict[str, Any]] = []
   for _ in range(max_scrolls):
-    rows = extractor(page)
-    for row in rows:
-      key = str(row.get("key") or "")
-      if not key:
-        continue
-      if key not in seen:
-        seen[key] = row
-    if len(seen) >= limit:
+    collected.extend(extractor(page, True))
+    if len(collected) >= limit:
       break
-    page.mouse.wheel(0, 2200)
+    page.evaluate("() => window.scrollBy(0, 2200)")
     page.wait_for_timeout(pause_ms)
-  return list(seen.values())[:limit]
+  return collected[:limit]
+
+
+_SESSION_COOKIE_BITS = {"auth_token": 1, "ct0": 2, "twid": 2}
 
 
 def _is_logged_in(page: Any) -> bool:
@@ -688,19 +1050,27 @@ def _is_logged_in(page: Any) -> bool:
   url = (page.url or "").lower()
   if "login" in url or "/i/flow" in url:
     return False
-  page.wait_for_timeout(1200)
-  markers = [
-    "[data-testid='SideNav_NewTweet_Button']",
-    "a[data-testid='AppTabBar_Profile_Link']",
-    "a[href='/home'][aria-label='Home']",
-  ]
-  if _visible_first(page, markers) is not None:
+  try:
+    page.wait_for_selector(_LOGIN_MARKER_QUERY, timeout=2000)
+    return True
+  except Exception:
+    pass
+  if _visible_first(page, _LOGIN_MARKER_SELECTORS) is not None:
     return True
   try:
-    names = {str(cookie.get("name") or "") for cookie in page.context.cookies("https://x.com")}
+    cookies = page.context.cookies("https://x.com")
   except Exception:
-    names = set()
-  return "auth_token" in names and ("ct0" in names or "twid" in names)
+    return False
+  # auth_token plus either ct0 or twid; track both conditions as bits and
+  # bail out as soon as they are satisfied instead of materializing a name set.
+  found = 0
+  for cookie in cookies:
+    bit = _SESSION_COOKIE_BITS.get(cookie.get("name"))
+    if bit:
+      found |= bit
+      if found == 3:
+        return True
+  return False
 
 
 def _require_logged_in(page: Any) -> None:
@@ -710,21 +1080,27 @@ def _require_logged_in(page: Any) -> None:
 
 def _attempt_flow_login(page: Any, username: str, password: str, email: str | None) -> dict[str, Any]:
   page.goto("https://x.com/i/flow/login", wait_until="domcontentloaded")
-  user_input = _visible_first(page, ["input[name='text']", "input[autocomplete='username']"])
+  user_input = _visible_first(page, _LOGIN_USER_INPUTS)
   if not user_input:
     raise CliError("Login input not found.")
   user_input.fill(username)
   user_input.press("Enter")
-  page.wait_for_timeout(1200)
+  try:
+    page.wait_for_selector(_LOGIN_STEP_QUERY, timeout=5000)
+  except Exception:
+    pass
 
-  pwd_input = _visible_first(page, ["input[name='password']", "input[type='password']"])
+  pwd_input = _visible_first(page, _LOGIN_PASSWORD_INPUTS)
   if not pwd_input:
-    challenge = _visible_first(page, ["input[name='text']", "input[autocomplete='username']"])
+    challenge = _visible_first(page, _LOGIN_USER_INPUTS)
     if challenge and email:
       challenge.fill(email)
       challenge.press("Enter")
-      page.wait_for_timeout(1200)
-      pwd_input = _visible_first(page, ["input[name='password']", "input[type='password']"])
+      try:
+        page.wait_for_selector(", ".join(_LOGIN_PASSWORD_INPUTS), timeout=5000)
+      except Exception:
+        pass
+      pwd_input = _visible_first(page, _LOGIN_PASSWORD_INPUTS)
 
   if not pwd_input:
     return {
@@ -735,20 +1111,107 @@ def _attempt_flow_login(page: Any, username: str, password: str, email: str | No
 
   pwd_input.fill(password)
   pwd_input.press("Enter")
-  page.wait_for_timeout(2200)
+  try:
+    page.wait_for_selector(_LOGIN_MARKER_QUERY, timeout=6000)
+  except Exception:
+    pass
   return {"logged_in": _is_logged_in(page), "status": "ok"}
 
 
+_PLAYWRIGHT: Any = None
+
+
+def _get_playwright() -> Any:
+  """Start the Playwright driver once per process; repeat commands reuse it."""
+  global _PLAYWRIGHT
+  if _PLAYWRIGHT is None:
+    try:
+      from playwright.sync_api import sync_playwright  # type: ignore
+    except Exception as err:
+      raise CliError("playwright is required. Run setup_env.sh first.") from err
+    _PLAYWRIGHT = sync_playwright().start()
+    atexit.register(_PLAYWRIGHT.stop)
+  return _PLAYWRIGHT
+
+
+_CHROMIUM_LAUNCH_ARGS = [
+  "--disable-blink-features=AutomationControlled",
+  "--disable-gpu",
+  "--disable-dev-shm-usage",
+  "--no-sandbox",
+]
+
+# Endpoints that only read DOM text; images and media are dead weight there.
+_READONLY_ENDPOINTS = frozenset({
+  "user_info",
+  "user_last_tweets",
+  "user_last_tweet",
+  "home_timeline",
+  "notifications_list",
+  "user_followers",
+  "user_followings",
+  "user_search",
+  "search_user",
+  "tweet_advanced_search",
+  "advanced_search",
+  "get_tweet_by_ids",
+  "tweetById",
+  "tweets",
+  "tweet_replies",
+  "tweet_quotes",
+  "tweet_retweeters",
+  "tweet_thread_context",
+  "trends",
+  "spaces_live",
+  "stream_live_search",
+})
+# Stylesheets stay loadable: x.com gates element visibility on CSS, and the
+# extractors (and :visible probes) key off rendered visibility.
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+
+def _is_readonly_endpoint(endpoint: Any) -> bool:
+  return endpoint in _READONLY_ENDPOINTS
+
+
+def _block_heavy_resources(route: Any) -> None:
+  if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+    route.abort()
+  else:
+    route.continue_()
+
+
+def _connect_shared_browser(p: Any) -> Any:
+  """Attach to the browserd-managed Chromium when one is running, else None.
+
+  Closing a connected browser only disconnects this client, so the per-command
+  teardown in the _run_* handlers leaves the shared browser warm.
+  """
+  path = _browserd_state_file()
+  if not path.exists():
+    return None
+  try:
+    state = _loadsb(path.read_bytes())
+    endpoint = str(state["endpoint"])
+    pid = int(state.get("pid") or 0)
+  except Exception:
+    return None
+  if pid and not _pid_running(pid):
+    path.unlink(missing_ok=True)
+    return None
+  try:
+    return p.chromium.connect_over_cdp(endpoint)
+  except Exception:
+    return None
+
+
 def _with_page(
   args: argparse.Namespace,
   require_session: bool = True,
   allow_browser_cookies: bool = True,
   allow_saved_session: bool = True,
 ):
-  try:
-    from playwright.sync_api import sync_playwright  # type: ignore
-  except Exception as err:
-    raise CliError("playwright is required. Run setup_env.sh first.") from err
+  p = _get_playwright()
 
   browser_cookies: list[dict[str, Any]] = []
   saved_cookies: list[dict[str, Any]] = []
@@ -773,51 +1236,139 @@ def _with_page(
       raise load_error
     raise CliError("No local session cookies found. Run user_login_v3 --refresh first.")
 
-  p = sync_playwright().start()
-  browser = p.chromium.launch(headless=not args.visible)
+  browser = _connect_shared_browser(p)
+  if browser is None:
+    browser = p.chromium.launch(headless=not args.visible, args=_CHROMIUM_LAUNCH_ARGS)
   context = browser.new_context()
+  context.add_init_script(_XLOCAL_INIT_JS)
   if cookies:
     context.add_cookies(cookies)
   page = context.new_page()
-  return p, browser, context, page
+  return browser, context, page
+
+
+_PAGE_POOL: dict[tuple[Any, ...], tuple[Any, Any]] = {}
+
+
+def _close_page_pool() -> None:
+  for browser, context in _PAGE_POOL.values():
+    try:
+      context.close()
+    except Exception:
+      pass
+    try:
+      browser.close()
+    except Exception:
+      pass
+  _PAGE_POOL.clear()
+
+
+atexit.register(_close_page_pool)
+
+
+def _acquire_page(
+  args: argparse.Namespace,
+  require_session: bool = True,
+  allow_browser_cookies: bool = True,
+  allow_saved_session: bool = True,
+) -> tuple[Any, Any]:
+  """Hand out a page plus a release callable.
+
+  Default-configured commands share one warm (browser, context) per process,
+  keyed by visibility plus the cookie-source flags so differently-configured
+  invocations never share a context's cookies: release() only closes the
+  page, so composite invocations skip repeat Chromium/context setup. --fresh,
+  and any call with non-default cookie flags (login refresh), keeps the old
+  isolated lifecycle. The read-only resource filter is installed per page,
+  never on the shared context, so it dies with the page that asked for it.
+  """
+  pooled_ok = require_session and allow_browser_cookies and allow_saved_session
+  if getattr(args, "fresh", False) or not pooled_ok:
+    browser, context, page = _with_page(
+      args,
+      require_session=require_session,
+      allow_browser_cookies=allow_browser_cookies,
+      allow_saved_session=allow_saved_session,
+    )
+    if _is_readonly_endpoint(getattr(args, "endpoint", None)):
+      page.route("**/*", _block_heavy_resources)
+
+    def release() -> None:
+      context.close()
+      browser.close()
+
+    return page, release
+
+  key = (
+    bool(getattr(args, "visible", False)),
+    args.browser,
+    args.chrome_profile,
+    args.chrome_profile_name,
+  )
+  pooled = _PAGE_POOL.get(key)
+  if pooled is None:
+    browser, context, page = _with_page(args)
+    _PAGE_POOL[key] = (browser, context)
+  else:
+    _, context = pooled
+    page = context.new_page()
+  if _is_readonly_endpoint(getattr(args, "endpoint", None)):
+    page.route("**/*", _block_heavy_resources)
+
+  def release() -> None:
+    try:
+      page.close()
+    except Exception:
+      pass
+
+  return page, release
+
+
+@contextlib.contextmanager
+def _page_ctx(
+  args: argparse.Namespace,
+  require_session: bool = True,
+  allow_browser_cookies: bool = True,
+  allow_saved_session: bool = True,
+) -> Any:
+  """Context-managed page acquisition; the one place teardown happens."""
+  page, release = _acquire_page(
+    args,
+    require_session=require_session,
+    allow_browser_cookies=allow_browser_cookies,
+    allow_saved_session=allow_saved_session,
+  )
+  try:
+    yield page
+  finally:
+    release()
 
 
 def _post_from_compose(page: Any, text: str, media_path: str | None = None) -> dict[str, Any]:
   page.goto("https://x.com/compose/post", wait_until="domcontentloaded")
-  editor = _visible_first(
-    page,
-    [
-      "div[contenteditable='true'][data-testid='tweetTextarea_0']",
-      "div[contenteditable='true']",
-      "[data-testid='tweetTextarea_0']",
-    ],
-  )
+  editor = _visible_first(page, _COMPOSE_EDITOR_SELECTORS)
   if not editor:
     raise CliError("Could not find post editor.")
   if text:
     editor.fill(text)
 
   if media_path:
-    file_input = _visible_first(page, ["input[data-testid='fileInput']", "input[type='file']"])
+    file_input = _visible_first(page, _COMPOSE_FILE_INPUTS)
     if not file_input:
       raise CliError("Could not find media upload input.")
     resolved = str(Path(media_path).expanduser().resolve())
     if not Path(resolved).exists():
       raise CliError(f"Media file not found: {resolved}")
     file_input.set_input_files(resolved)
-    page.wait_for_timeout(800)
+    try:
+      page.wait_for_selector("[data-testid='attachments']", timeout=10000)
+    except Exception:
+      pass
 
-  if not _click_first(
-    page,
-    [
-      "button[data-testid='tweetButton']",
-      "button[data-testid='tweetButtonInline']",
-      "button:has-text('Post')",
-    ],
-  ):
+  if not _click_first(page, _POST_BUTTON_SELECTORS):
     raise CliError("Could not press Post.")
 
-  page.wait_for_timeout(1200)
+  _wait_gone(page, _POST_BUTTON_SELECTORS, timeout=6000)
   return {"submitted": True, "text": text, "media_path": media_path}
 
 
@@ -826,19 +1377,18 @@ def _run_user_login_v3(args: argparse.Namespace) -> dict[str, Any]:
   username = _arg_value(args, "username", "user_name")
   password = _arg_value(args, "password")
   email = _arg_value(args, "email")
-  p, browser, context, page = _with_page(
+  with _page_ctx(
     args,
     require_session=False,
     allow_browser_cookies=not refresh,
     allow_saved_session=not refresh,
-  )
-  try:
+  ) as page:
     if refresh:
       if not username or not password:
         raise CliError("--refresh requires --username/--user-name and --password.")
       login_result = _attempt_flow_login(page, username, password, email or None)
       logged_in = bool(login_result.get("logged_in"))
-      saved = _save_session_cookies(context) if logged_in else 0
+      saved = _save_session_cookies(page.context) if logged_in else 0
       login_result["refreshed"] = logged_in
       login_result["session_cookies_saved"] = saved
       if username:
@@ -846,7 +1396,7 @@ def _run_user_login_v3(args: argparse.Namespace) -> dict[str, Any]:
       return login_result
 
     if _is_logged_in(page):
-      saved = _save_session_cookies(context)
+      saved = _save_session_cookies(page.context)
       payload = {"logged_in": True, "status": "ok", "method": "cookies", "session_cookies_saved": saved}
       if username:
         payload["user_name"] = username
@@ -860,44 +1410,29 @@ def _run_user_login_v3(args: argparse.Namespace) -> dict[str, Any]:
       }
     login_result = _attempt_flow_login(page, username, password, email or None)
     logged_in = bool(login_result.get("logged_in"))
-    saved = _save_session_cookies(context) if logged_in else 0
+    saved = _save_session_cookies(page.context) if logged_in else 0
     login_result["session_cookies_saved"] = saved
     login_result["user_name"] = username
     return login_result
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_get_my_x_account_detail_v3(args: argparse.Namespace) -> dict[str, Any]:
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
     handle = _normalize_handle(_arg_value(args, "user_name", "username")) or _extract_handle_from_nav(page)
     if not handle:
       raise CliError("Could not resolve account handle from current session.")
-    page.goto(f"https://x.com/{handle}", wait_until="domcontentloaded")
-    page.wait_for_timeout(700)
+    _goto_ready(page, f"https://x.com/{handle}", _PRIMARY_COLUMN)
     return _extract_profile_summary(page, handle)
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_send_tweet_v3(args: argparse.Namespace) -> dict[str, Any]:
   text = (args.text or "").strip()
   if not text:
     raise CliError("--text is required.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
     return _post_from_compose(page, text)
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_create_tweet_v2(args: argparse.Namespace) -> dict[str, Any]:
@@ -909,169 +1444,131 @@ def _run_upload_media_v2(args: argparse.Namespace) -> dict[str, Any]:
   text = (args.text or "").strip()
   if not media_path:
     raise CliError("--media-path is required.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
     return _post_from_compose(page, text=text, media_path=media_path)
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_like_tweet_v3(args: argparse.Namespace) -> dict[str, Any]:
   tweet_id = (args.tweet_id or "").strip()
   if not tweet_id:
     raise CliError("--tweet-id is required.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/i/web/status/{tweet_id}", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
-    if _visible_first(page, ["button[data-testid='unlike']"]):
+    _goto_ready(page, f"https://x.com/i/web/status/{tweet_id}", _LIKE_BUTTON + _UNLIKE_BUTTON)
+    if _visible_first(page, _UNLIKE_BUTTON):
       return {"tweet_id": tweet_id, "liked": True, "already_liked": True}
-    if not _click_first(page, ["button[data-testid='like']"]):
+    if not _click_first(page, _LIKE_BUTTON):
       raise CliError("Could not find Like button.")
-    page.wait_for_timeout(650)
+    try:
+      page.wait_for_selector("button[data-testid='unlike']", timeout=5000)
+    except Exception:
+      pass
     return {
       "tweet_id": tweet_id,
-      "liked": _visible_first(page, ["button[data-testid='unlike']"]) is not None,
+      "liked": _visible_first(page, _UNLIKE_BUTTON) is not None,
       "already_liked": False,
     }
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_unlike_tweet_v2(args: argparse.Namespace) -> dict[str, Any]:
   tweet_id = (args.tweet_id or "").strip()
   if not tweet_id:
     raise CliError("--tweet-id is required.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/i/web/status/{tweet_id}", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
-    if _visible_first(page, ["button[data-testid='like']"]):
+    _goto_ready(page, f"https://x.com/i/web/status/{tweet_id}", _LIKE_BUTTON + _UNLIKE_BUTTON)
+    if _visible_first(page, _LIKE_BUTTON):
       return {"tweet_id": tweet_id, "liked": False, "already_unliked": True}
-    if not _click_first(page, ["button[data-testid='unlike']"]):
+    if not _click_first(page, _UNLIKE_BUTTON):
       raise CliError("Could not find Unlike button.")
-    page.wait_for_timeout(650)
+    _wait_any(page, _LIKE_BUTTON)
     return {
       "tweet_id": tweet_id,
-      "liked": _visible_first(page, ["button[data-testid='unlike']"]) is not None,
+      "liked": _visible_first(page, _UNLIKE_BUTTON) is not None,
       "already_unliked": False,
     }
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_retweet_v3(args: argparse.Namespace) -> dict[str, Any]:
   tweet_id = (args.tweet_id or "").strip()
   if not tweet_id:
     raise CliError("--tweet-id is required.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/i/web/status/{tweet_id}", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
-    if _visible_first(page, ["button[data-testid='unretweet']"]):
+    _goto_ready(page, f"https://x.com/i/web/status/{tweet_id}", _RETWEET_BUTTON + _UNRETWEET_BUTTON)
+    if _visible_first(page, _UNRETWEET_BUTTON):
       return {"tweet_id": tweet_id, "retweeted": True, "already_retweeted": True}
-    if not _click_first(page, ["button[data-testid='retweet']"]):
+    if not _click_first(page, _RETWEET_BUTTON):
       raise CliError("Could not find Repost button.")
-    page.wait_for_timeout(300)
-    if not _click_first(page, ["div[data-testid='retweetConfirm']", "button:has-text('Repost')"]):
+    _wait_any(page, _RETWEET_CONFIRM_BUTTONS, timeout=3000)
+    if not _click_first(page, _RETWEET_CONFIRM_BUTTONS):
       raise CliError("Could not confirm repost.")
-    page.wait_for_timeout(650)
+    _wait_any(page, _UNRETWEET_BUTTON)
     return {
       "tweet_id": tweet_id,
-      "retweeted": _visible_first(page, ["button[data-testid='unretweet']"]) is not None,
+      "retweeted": _visible_first(page, _UNRETWEET_BUTTON) is not None,
       "already_retweeted": False,
     }
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_delete_tweet_v2(args: argparse.Namespace) -> dict[str, Any]:
   tweet_id = (args.tweet_id or "").strip()
   if not tweet_id:
     raise CliError("--tweet-id is required.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/i/web/status/{tweet_id}", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
-    if not _click_first(page, ["button[data-testid='caret']", "button:has-text('More')"]):
+    _goto_ready(page, f"https://x.com/i/web/status/{tweet_id}", _TWEET_MENU_BUTTONS)
+    if not _click_first(page, _TWEET_MENU_BUTTONS):
       raise CliError("Could not open tweet menu.")
-    page.wait_for_timeout(350)
-    if not _click_first(page, ["div[role='menuitem']:has-text('Delete')", "div[role='menuitem']:has-text('Delete post')"]):
+    _wait_any(page, _DELETE_MENU_ITEMS, timeout=3000)
+    if not _click_first(page, _DELETE_MENU_ITEMS):
       raise CliError("Could not find Delete in menu.")
-    page.wait_for_timeout(300)
-    if not _click_first(page, ["button:has-text('Delete')", "div[role='button']:has-text('Delete')"]):
+    _wait_any(page, _DELETE_CONFIRM_BUTTONS, timeout=3000)
+    if not _click_first(page, _DELETE_CONFIRM_BUTTONS):
       raise CliError("Could not confirm delete.")
-    page.wait_for_timeout(900)
+    _wait_gone(page, _DELETE_CONFIRM_BUTTONS)
     return {"tweet_id": tweet_id, "deleted": True}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_follow_user_v2(args: argparse.Namespace) -> dict[str, Any]:
   username = _normalize_handle(args.username)
   if not username:
     raise CliError("--username is required.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/{username}", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
-    if _visible_first(page, ["button:has-text('Following')", "button:has-text('Unfollow')"]):
+    _goto_ready(page, f"https://x.com/{username}", _FOLLOW_BUTTONS + _FOLLOWING_BUTTONS)
+    if _visible_first(page, _FOLLOWING_BUTTONS):
       return {"username": username, "following": True, "already_following": True}
-    if not _click_first(page, ["button:has-text('Follow')", "div[role='button']:has-text('Follow')"]):
+    if not _click_first(page, _FOLLOW_BUTTONS):
       raise CliError("Could not find Follow button.")
-    page.wait_for_timeout(750)
+    _wait_any(page, _FOLLOWING_BUTTONS)
     return {
       "username": username,
-      "following": _visible_first(page, ["button:has-text('Following')", "button:has-text('Unfollow')"]) is not None,
+      "following": _visible_first(page, _FOLLOWING_BUTTONS) is not None,
       "already_following": False,
     }
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_unfollow_user_v2(args: argparse.Namespace) -> dict[str, Any]:
   username = _normalize_handle(args.username)
   if not username:
     raise CliError("--username is required.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/{username}", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
-    if _visible_first(page, ["button:has-text('Follow')"]):
+    _goto_ready(page, f"https://x.com/{username}", _FOLLOW_BUTTON + _FOLLOWING_BUTTONS)
+    if _visible_first(page, _FOLLOW_BUTTON):
       return {"username": username, "following": False, "already_unfollowed": True}
-    if not _click_first(page, ["button:has-text('Following')", "button:has-text('Unfollow')"]):
+    if not _click_first(page, _FOLLOWING_BUTTONS):
       raise CliError("Could not find Following button.")
-    page.wait_for_timeout(300)
-    _click_first(page, ["button:has-text('Unfollow')", "div[role='button']:has-text('Unfollow')"])
-    page.wait_for_timeout(700)
+    _wait_any(page, _UNFOLLOW_CONFIRM_BUTTONS, timeout=3000)
+    _click_first(page, _UNFOLLOW_CONFIRM_BUTTONS)
+    _wait_any(page, _FOLLOW_BUTTON)
     return {
       "username": username,
-      "following": _visible_first(page, ["button:has-text('Following')", "button:has-text('Unfollow')"]) is not None,
+      "following": _visible_first(page, _FOLLOWING_BUTTONS) is not None,
       "already_unfollowed": False,
     }
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_send_dm_to_user(args: argparse.Namespace) -> dict[str, Any]:
@@ -1081,81 +1578,48 @@ def _run_send_dm_to_user(args: argparse.Namespace) -> dict[str, Any]:
     raise CliError("--username is required.")
   if not text:
     raise CliError("--text is required.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/{username}", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
-    if not _click_first(page, ["button[data-testid='sendDMFromProfile']", "button:has-text('Message')"]):
+    _goto_ready(page, f"https://x.com/{username}", _DM_MESSAGE_BUTTONS)
+    if not _click_first(page, _DM_MESSAGE_BUTTONS):
       raise CliError("Could not find Message button on profile.")
-    page.wait_for_timeout(800)
-    editor = _visible_first(page, ["div[data-testid='dmComposerTextInput'] div[contenteditable='true']", "div[contenteditable='true']"])
+    _wait_any(page, _DM_EDITOR_SELECTORS)
+    editor = _visible_first(page, _DM_EDITOR_SELECTORS)
     if not editor:
       raise CliError("Could not find DM input.")
     editor.fill(text)
-    if not _click_first(page, ["button[data-testid='dmComposerSendButton']", "button:has-text('Send')"]):
+    if not _click_first(page, _DM_SEND_BUTTONS):
       raise CliError("Could not send DM.")
-    page.wait_for_timeout(600)
+    _wait_any(page, ("[data-testid='messageEntry']",), timeout=4000)
     return {"username": username, "sent": True, "text": text}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_update_profile_v3(args: argparse.Namespace) -> dict[str, Any]:
   if not args.name and not args.bio:
     raise CliError("Provide --name and/or --bio.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto("https://x.com/settings/profile", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
+    _goto_ready(page, "https://x.com/settings/profile", _PROFILE_NAME_INPUTS)
     updated_fields: list[str] = []
 
     if args.name:
-      name_input = _visible_first(
-        page,
-        [
-          "input[name='displayName']",
-          "input[aria-label='Name']",
-          "input[data-testid='Profile_Name_Input']",
-        ],
-      )
+      name_input = _visible_first(page, _PROFILE_NAME_INPUTS)
       if not name_input:
         raise CliError("Could not find profile name field.")
       name_input.fill(args.name)
       updated_fields.append("name")
 
     if args.bio:
-      bio_input = _visible_first(
-        page,
-        [
-          "textarea[name='description']",
-          "textarea[aria-label='Bio']",
-          "textarea[data-testid='Profile_Bio_Input']",
-        ],
-      )
+      bio_input = _visible_first(page, _PROFILE_BIO_INPUTS)
       if not bio_input:
         raise CliError("Could not find profile bio field.")
       bio_input.fill(args.bio)
       updated_fields.append("bio")
 
-    if not _click_first(
-      page,
-      [
-        "div[data-testid='Profile_Save_Button']",
-        "button[data-testid='Profile_Save_Button']",
-        "button:has-text('Save')",
-      ],
-    ):
+    if not _click_first(page, _PROFILE_SAVE_BUTTONS):
       raise CliError("Could not find Save button on profile settings.")
-    page.wait_for_timeout(1000)
+    _wait_gone(page, _PROFILE_SAVE_BUTTONS)
     return {"updated": True, "fields": updated_fields}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_update_media_profile(args: argparse.Namespace, mode: str) -> dict[str, Any]:
@@ -1166,41 +1630,38 @@ def _run_update_media_profile(args: argparse.Namespace, mode: str) -> dict[str,
   if not resolved.exists():
     raise CliError(f"File not found: {resolved}")
 
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto("https://x.com/settings/profile", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
-    inputs = page.locator("input[type='file']")
-    count = inputs.count()
-    if count <= 0:
+    # Back-to-back avatar+banner updates on a pooled page land here already on
+    # the settings screen; skip the repeat render in that case.
+    if not page.url.endswith("/settings/profile"):
+      _goto_ready(page, "https://x.com/settings/profile", ("input[type='file']",))
+    else:
+      _wait_any(page, ("input[type='file']",))
+    inputs = page.locator("input[type='file']").all()
+    if not inputs:
       raise CliError("Could not find profile file upload input.")
-    target_idx = 0 if mode == "avatar" else (1 if count > 1 else 0)
-    inputs.nth(target_idx).set_input_files(str(resolved))
-    page.wait_for_timeout(900)
-    _click_first(page, ["button:has-text('Apply')", "button:has-text('Save')", "div[data-testid='Profile_Save_Button']"])
-    page.wait_for_timeout(900)
+    target_idx = 0 if mode == "avatar" else (1 if len(inputs) > 1 else 0)
+    inputs[target_idx].set_input_files(str(resolved))
+    _wait_any(page, _PROFILE_APPLY_BUTTONS, timeout=6000)
+    _click_first(page, _PROFILE_APPLY_BUTTONS)
+    _wait_gone(page, _PROFILE_APPLY_BUTTONS)
     return {"updated": True, "mode": mode, "file_path": str(resolved)}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_user_info(args: argparse.Namespace) -> dict[str, Any]:
   username = _normalize_handle(args.username)
   if not username:
     raise CliError("--username is required.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/{username}", wait_until="domcontentloaded")
-    page.wait_for_timeout(700)
+    _goto_ready(
+      page,
+      f"https://x.com/{username}",
+      ("div[data-testid='UserName']", "[data-testid='UserProfileHeader_Items']"),
+      timeout=7000,
+    )
     return _extract_profile_summary(page, username)
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_user_last_tweets(args: argparse.Namespace) -> dict[str, Any]:
@@ -1208,47 +1669,29 @@ def _run_user_last_tweets(args: argparse.Namespace) -> dict[str, Any]:
   if not username:
     raise CliError("--username is required.")
   limit = max(1, min(args.limit, 200))
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/{username}", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
+    _goto_ready(page, f"https://x.com/{username}", _TWEET_CELL)
     tweets = _collect_with_scroll(page, _extract_tweets, limit)
     return {"username": username, "count": len(tweets), "tweets": tweets}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_home_timeline(args: argparse.Namespace) -> dict[str, Any]:
   limit = max(1, min(args.limit, 200))
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto("https://x.com/home", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
+    _goto_ready(page, "https://x.com/home", _TWEET_CELL)
     tweets = _collect_with_scroll(page, _extract_tweets, limit, max_scrolls=20)
     return {"count": len(tweets), "tweets": tweets}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_notifications_list(args: argparse.Namespace) -> dict[str, Any]:
   limit = max(1, min(args.limit, 300))
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto("https://x.com/notifications", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
+    _goto_ready(page, "https://x.com/notifications", _LIST_CELLS)
     rows = _collect_with_scroll(page, _extract_notifications, limit, max_scrolls=16)
     return {"count": len(rows), "notifications": rows}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_user_connections(args: argparse.Namespace, mode: str) -> dict[str, Any]:
@@ -1257,17 +1700,11 @@ def _run_user_connections(args: argparse.Namespace, mode: str) -> dict[str, Any]
     raise CliError("--username is required.")
   limit = max(1, min(args.limit, 500))
   suffix = "followers" if mode == "followers" else "following"
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/{username}/{suffix}", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
+    _goto_ready(page, f"https://x.com/{username}/{suffix}", _LIST_CELLS)
     users = _collect_with_scroll(page, _extract_users, limit, max_scrolls=18)
     return {"username": username, "mode": mode, "count": len(users), "users": users}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_search_user(args: argparse.Namespace) -> dict[str, Any]:
@@ -1275,18 +1712,15 @@ def _run_search_user(args: argparse.Namespace) -> dict[str, Any]:
   if not keyword:
     raise CliError("--keyword is required.")
   limit = max(1, min(args.limit, 200))
-  encoded = urllib.parse.quote(keyword)
-  p, browser, context, page = _with_page(args)
-  try:
+  encoded = _qenc(keyword)
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/search?q={encoded}&src=typed_query&f=user", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
+    _goto_ready(page, f"https://x.com/search?q={encoded}&src=typed_query&f=user", _LIST_CELLS)
     users = _collect_with_scroll(page, _extract_users, limit, max_scrolls=16)
     return {"keyword": keyword, "count": len(users), "users": users}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
+
+
+_SEARCH_TABS = frozenset({"top", "latest"})
 
 
 def _run_advanced_search(args: argparse.Namespace) -> dict[str, Any]:
@@ -1295,54 +1729,162 @@ def _run_advanced_search(args: argparse.Namespace) -> dict[str, Any]:
     raise CliError("--query is required.")
   limit = max(1, min(args.limit, 200))
   tab = (args.tab or "latest").strip().lower()
-  if tab not in {"top", "latest"}:
+  if tab not in _SEARCH_TABS:
     raise CliError("--tab must be one of: top, latest")
-  encoded = urllib.parse.quote(query)
+  encoded = _qenc(query)
   f_param = "live" if tab == "latest" else "top"
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/search?q={encoded}&src=typed_query&f={f_param}", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
+    _goto_ready(page, f"https://x.com/search?q={encoded}&src=typed_query&f={f_param}", _TWEET_CELL)
     tweets = _collect_with_scroll(page, _extract_tweets, limit, max_scrolls=18)
     return {"query": query, "tab": tab, "count": len(tweets), "tweets": tweets}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
+
+
+_SYNDICATION_HOST = "cdn.syndication.twimg.com"
+
+
+def _syndication_token(tweet_id: str) -> str:
+  """Token the embed widget derives per tweet: ((id / 1e15) * pi) rendered in
+  base36 with every zero digit and the radix point stripped.
+
+  Fractional digits follow JS Number.toString(36) semantics -- shortest
+  round-trip with the last digit rounded to nearest -- so the token matches
+  what the widget would send byte for byte.
+  """
+  import math
+
+  value = (int(tweet_id) / 1e15) * math.pi
+  digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+  whole = int(value)
+  frac = value - whole
+  out = []
+  n = whole
+  if n == 0:
+    out.append("0")
+  while n:
+    out.append(digits[n % 36])
+    n //= 36
+  out.reverse()
+  if frac > 0:
+    out.append(".")
+    eps = math.ulp(value) / 2
+    scale = 1.0
+    while True:
+      frac *= 36
+      scale /= 36
+      digit = int(frac)
+      frac -= digit
+      out.append(digits[digit])
+      if frac * scale < eps or (1 - frac) * scale < eps:
+        if frac > 0.5:
+          i = len(out) - 1
+          while i >= 0:
+            char = out[i]
+            if char == ".":
+              i -= 1
+              continue
+            bumped = digits.index(char) + 1
+            if bumped < 36:
+              out[i] = digits[bumped]
+              break
+            out[i] = "0"
+            i -= 1
+        break
+  return "".join(out).replace("0", "").replace(".", "")
+
+
+def _syndication_tweet(tweet_id: str) -> dict[str, Any] | None:
+  """Fetch a single tweet from the public syndication CDN, shaped like a DOM
+  extractor row; None on any failure so callers fall back to the browser."""
+  query = urllib.parse.urlencode({"id": tweet_id, "lang": "en", "token": _syndication_token(tweet_id)})
+  import http.client
+
+  try:
+    conn = http.client.HTTPSConnection(_SYNDICATION_HOST, timeout=6)
+    try:
+      conn.request("GET", f"/tweet-result?{query}", headers={"User-Agent": "Mozilla/5.0"})
+      resp = conn.getresponse()
+      body = resp.read()
+      if resp.status != 200:
+        return None
+      data = _loadsb(body)
+    finally:
+      conn.close()
+  except Exception:
+    return None
+  if not isinstance(data, dict) or not data.get("id_str"):
+    return None
+  tweet_id_str = str(data["id_str"])
+  user = data.get("user") or {}
+  author = user.get("screen_name")
+  media = data.get("mediaDetails") or []
+  image_urls = [m.get("media_url_https") for m in media if m.get("type") == "photo" and m.get("media_url_https")]
+  has_video = any(m.get("type") in ("video", "animated_gif") for m in media)
+  return {
+    "key": tweet_id_str,
+    "tweet_id": tweet_id_str,
+    "text": (data.get("text") or "").strip(),
+    "author": author,
+    "url": f"https://x.com/{author}/status/{tweet_id_str}" if author else None,
+    "timestamp": data.get("created_at"),
+    "social_context": None,
+    "image_urls": image_urls,
+    "media_urls": image_urls,
+    "has_video": has_video,
+    "has_media": bool(media),
+    "media_count": len(media),
+    "is_repost_hint": False,
+  }
 
 
 def _run_get_tweet_by_ids(args: argparse.Namespace) -> dict[str, Any]:
-  ids: list[str] = []
-  if args.tweet_ids:
-    ids.extend([item.strip() for item in args.tweet_ids.split(",") if item.strip()])
-  if args.tweet_id:
-    ids.extend([item.strip() for item in args.tweet_id if item.strip()])
-  unique: list[str] = []
-  seen = set()
-  for item in ids:
-    if item in seen:
-      continue
-    seen.add(item)
-    unique.append(item)
+  unique = list(dict.fromkeys(
+    stripped
+    for item in itertools.chain((args.tweet_ids or "").split(","), args.tweet_id or [])
+    if (stripped := item.strip())
+  ))
   if not unique:
     raise CliError("Provide --tweet-ids or --tweet-id.")
 
-  p, browser, context, page = _with_page(args)
-  try:
-    _require_logged_in(page)
-    tweets: list[dict[str, Any]] = []
-    for tweet_id in unique:
-      page.goto(f"https://x.com/i/web/status/{tweet_id}", wait_until="domcontentloaded")
-      page.wait_for_timeout(800)
-      rows = _extract_tweets(page)
-      exact = next((row for row in rows if str(row.get("tweet_id")) == tweet_id), None)
-      tweets.append({"requested_tweet_id": tweet_id, "tweet": exact or (rows[0] if rows else None)})
-    return {"count": len(tweets), "tweets": tweets}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
+  # Try the renderless syndication path first; only IDs it cannot resolve pay
+  # for a browser session.
+  resolved: dict[str, dict[str, Any]] = {}
+  pending: list[str] = []
+  for tweet_id in unique:
+    row = _syndication_tweet(tweet_id)
+    if row is not None:
+      resolved[tweet_id] = {"requested_tweet_id": tweet_id, "tweet": row}
+    else:
+      pending.append(tweet_id)
+
+  if pending:
+    with _page_ctx(args) as page:
+      _require_logged_in(page)
+      # Overlap navigations across a small tab pool: goto with wait_until="commit"
+      # returns as soon as the navigation lands, so all tabs render concurrently
+      # while we harvest them in order.
+      for start in range(0, len(pending), 8):
+        batch = pending[start:start + 8]
+        extras = []
+        for _ in batch[1:]:
+          tab = page.context.new_page()
+          # Routes are per page now, so extra tabs opt into the read-only
+          # resource filter themselves instead of inheriting it.
+          tab.route("**/*", _block_heavy_resources)
+          extras.append(tab)
+        pages = [page] + extras
+        for tab, tweet_id in zip(pages, batch):
+          tab.goto(f"https://x.com/i/web/status/{tweet_id}", wait_until="commit")
+        for tab, tweet_id in zip(pages, batch):
+          _wait_any(tab, ("article[data-testid='tweet']",), timeout=8000)
+          rows = _extract_tweets(tab)
+          exact = next((row for row in rows if str(row.get("tweet_id")) == tweet_id), None)
+          resolved[tweet_id] = {"requested_tweet_id": tweet_id, "tweet": exact or (rows[0] if rows else None)}
+        for tab in pages[1:]:
+          tab.close()
+
+  tweets = [resolved.get(tid) or {"requested_tweet_id": tid, "tweet": None} for tid in unique]
+  return {"count": len(tweets), "tweets": tweets}
 
 
 def _run_tweet_replies(args: argparse.Namespace) -> dict[str, Any]:
@@ -1350,18 +1892,12 @@ def _run_tweet_replies(args: argparse.Namespace) -> dict[str, Any]:
   if not tweet_id:
     raise CliError("--tweet-id is required.")
   limit = max(1, min(args.limit, 200))
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/i/web/status/{tweet_id}", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
+    _goto_ready(page, f"https://x.com/i/web/status/{tweet_id}", _TWEET_CELL)
     tweets = _collect_with_scroll(page, _extract_tweets, limit + 2, max_scrolls=18)
     replies = [row for row in tweets if str(row.get("tweet_id") or "") != tweet_id][:limit]
     return {"tweet_id": tweet_id, "count": len(replies), "replies": replies}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_tweet_quotes(args: argparse.Namespace) -> dict[str, Any]:
@@ -1369,17 +1905,11 @@ def _run_tweet_quotes(args: argparse.Namespace) -> dict[str, Any]:
   if not tweet_id:
     raise CliError("--tweet-id is required.")
   limit = max(1, min(args.limit, 200))
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/i/web/status/{tweet_id}/quotes", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
+    _goto_ready(page, f"https://x.com/i/web/status/{tweet_id}/quotes", _TWEET_CELL)
     quotes = _collect_with_scroll(page, _extract_tweets, limit, max_scrolls=18)
     return {"tweet_id": tweet_id, "count": len(quotes), "quotes": quotes}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_tweet_retweeters(args: argparse.Namespace) -> dict[str, Any]:
@@ -1387,17 +1917,11 @@ def _run_tweet_retweeters(args: argparse.Namespace) -> dict[str, Any]:
   if not tweet_id:
     raise CliError("--tweet-id is required.")
   limit = max(1, min(args.limit, 400))
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/i/web/status/{tweet_id}/retweets", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
+    _goto_ready(page, f"https://x.com/i/web/status/{tweet_id}/retweets", _LIST_CELLS)
     users = _collect_with_scroll(page, _extract_users, limit, max_scrolls=18)
     return {"tweet_id": tweet_id, "count": len(users), "retweeters": users}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_tweet_thread_context(args: argparse.Namespace) -> dict[str, Any]:
@@ -1405,92 +1929,61 @@ def _run_tweet_thread_context(args: argparse.Namespace) -> dict[str, Any]:
   if not tweet_id:
     raise CliError("--tweet-id is required.")
   limit = max(1, min(args.limit, 200))
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/i/web/status/{tweet_id}", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
+    _goto_ready(page, f"https://x.com/i/web/status/{tweet_id}", _TWEET_CELL, timeout=7000)
     thread = _collect_with_scroll(page, _extract_tweets, limit, max_scrolls=20)
     return {"tweet_id": tweet_id, "count": len(thread), "thread": thread}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_trends(args: argparse.Namespace) -> dict[str, Any]:
   limit = max(1, min(args.limit, 100))
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto("https://x.com/explore/tabs/trending", wait_until="domcontentloaded")
-    page.wait_for_timeout(1000)
+    _goto_ready(page, "https://x.com/explore/tabs/trending", _TREND_CELLS)
     trends = _collect_with_scroll(page, _extract_trends, limit, max_scrolls=6)
     return {"count": len(trends), "trends": trends}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_spaces_detail(args: argparse.Namespace) -> dict[str, Any]:
   space_id = (args.space_id or "").strip()
   if not space_id:
     raise CliError("--space-id is required.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/i/spaces/{space_id}", wait_until="domcontentloaded")
-    page.wait_for_timeout(1000)
+    _goto_ready(
+      page,
+      f"https://x.com/i/spaces/{space_id}",
+      ("[data-testid='sheetDialog']",) + _PRIMARY_COLUMN,
+      timeout=7000,
+    )
     return _extract_space_detail(page, space_id)
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_spaces_live(args: argparse.Namespace) -> dict[str, Any]:
   limit = max(1, min(args.limit, 100))
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto("https://x.com/i/spaces", wait_until="domcontentloaded")
-    page.wait_for_timeout(1000)
+    _goto_ready(page, "https://x.com/i/spaces", _LIST_CELLS)
     spaces = _collect_with_scroll(page, _extract_spaces, limit, max_scrolls=8)
     return {"count": len(spaces), "spaces": spaces}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _run_spaces_listen(args: argparse.Namespace) -> dict[str, Any]:
   space_id = (args.space_id or "").strip()
   if not space_id:
     raise CliError("--space-id is required.")
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
-    page.goto(f"https://x.com/i/spaces/{space_id}", wait_until="domcontentloaded")
-    page.wait_for_timeout(1000)
-    joined = _click_first(
-      page,
-      [
-        "button:has-text('Start listening')",
-        "button:has-text('Listen live')",
-        "button:has-text('Join this Space')",
-        "button:has-text('Join')",
-      ],
-    )
+    _goto_ready(page, f"https://x.com/i/spaces/{space_id}", _SPACE_LISTEN_BUTTONS)
+    joined = _click_first(page, _SPACE_LISTEN_BUTTONS)
     page.wait_for_timeout(800)
     return {"space_id": space_id, "joined": joined}
-  finally:
-    context.close()
-    browser.close()
-    p.stop()
 
 
 def _ensure_ffmpeg() -> None:
+  import shutil
+
   if not shutil.which("ffmpeg"):
     raise CliError("ffmpeg is required for live streaming. Install ffmpeg first.")
 
@@ -1515,6 +2008,17 @@ def _pid_running(pid: int) -> bool:
   return True
 
 
+def _write_json_atomic(path: Path, payload: Any) -> None:
+  """Serialize and publish via rename so readers never see a torn file."""
+  tmp = path.with_suffix(".tmp")
+  fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+  try:
+    os.write(fd, _dumpsb(payload))
+  finally:
+    os.close(fd)
+  os.replace(tmp, path)
+
+
 def _run_stream_status(args: argparse.Namespace) -> dict[str, Any]:
   pid_path = _stream_pid_file()
   meta_path = _stream_meta_file()
@@ -1528,7 +2032,7 @@ def _run_stream_status(args: argparse.Namespace) -> dict[str, Any]:
   meta: dict[str, Any] = {}
   if meta_path.exists():
     try:
-      loaded = json.loads(meta_path.read_text(encoding="utf-8"))
+      loaded = _loadsb(meta_path.read_bytes())
       if isinstance(loaded, dict):
         meta = loaded
     except Exception:
@@ -1536,6 +2040,83 @@ def _run_stream_status(args: argparse.Namespace) -> dict[str, Any]:
   return {"running": running, "pid": pid, "meta": meta, "log_file": str(_stream_log_file())}
 
 
+_HW_ENCODER_CODECS = {
+  "nvenc": "h264_nvenc",
+  "vaapi": "h264_vaapi",
+  "videotoolbox": "h264_videotoolbox",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_encoders() -> frozenset[str]:
+  """Names ffmpeg was built with, probed once per process."""
+  try:
+    out = subprocess.run(
+      ["ffmpeg", "-hide_banner", "-encoders"],
+      capture_output=True, text=True, timeout=10, check=False,
+    ).stdout
+  except Exception:
+    return frozenset()
+  names = set()
+  for line in out.splitlines():
+    parts = line.split()
+    if len(parts) >= 2 and parts[0] and parts[0][0] in "VAS":
+      names.add(parts[1])
+  return frozenset(names)
+
+
+@functools.lru_cache(maxsize=8)
+def _probe_codecs(input_value: str) -> tuple[str | None, str | None]:
+  """(video, audio) codec names of the input via ffprobe, probed once."""
+
+  def probe(stream: str) -> str | None:
+    try:
+      out = subprocess.run(
+        [
+          "ffprobe", "-v", "error", "-select_streams", stream,
+          "-show_entries", "stream=codec_name", "-of", "csv=p=0", input_value,
+        ],
+        capture_output=True, text=True, timeout=10, check=False,
+      ).stdout.strip()
+    except Exception:
+      return None
+    return out.splitlines()[0] if out else None
+
+  return probe("v:0"), probe("a:0")
+
+
+def _nvidia_present() -> bool:
+  import shutil
+
+  return Path("/dev/nvidia0").exists() or shutil.which("nvidia-smi") is not None
+
+
+def _resolve_encoder(choice: str) -> str:
+  if choice != "auto":
+    return choice
+  available = _ffmpeg_encoders()
+  # Build support alone proves nothing: distro/static ffmpeg ships NVENC on
+  # GPU-less boxes, so gate on the device like the VAAPI branch below.
+  if "h264_nvenc" in available and _nvidia_present():
+    return "nvenc"
+  if "h264_videotoolbox" in available:
+    return "videotoolbox"
+  if "h264_vaapi" in available and Path("/dev/dri/renderD128").exists():
+    return "vaapi"
+  return "x264"
+
+
+def _video_encode_args(encoder: str, args: argparse.Namespace) -> list[str]:
+  rate = ["-b:v", args.video_bitrate, "-maxrate", args.video_bitrate, "-bufsize", args.buffer_size, "-g", "60"]
+  if encoder == "nvenc":
+    return ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "cbr"] + rate
+  if encoder == "vaapi":
+    return ["-vaapi_device", "/dev/dri/renderD128", "-vf", "format=nv12,hwupload", "-c:v", "h264_vaapi"] + rate
+  if encoder == "videotoolbox":
+    return ["-c:v", "h264_videotoolbox", "-realtime", "true"] + rate
+  return ["-c:v", "libx264", "-preset", args.preset, "-pix_fmt", "yuv420p"] + rate
+
+
 def _run_stream_start(args: argparse.Namespace) -> dict[str, Any]:
   _ensure_ffmpeg()
   status = _run_stream_status(args)
@@ -1547,52 +2128,48 @@ def _run_stream_start(args: argparse.Namespace) -> dict[str, Any]:
   if not input_value:
     raise CliError("--input is required (video file/device/stream source).")
 
-  cmd = ["ffmpeg", "-hide_banner", "-loglevel", "warning"]
-  if args.loop:
-    cmd.extend(["-stream_loop", "-1"])
-  cmd.extend(
-    [
-      "-re",
-      "-i",
-      input_value,
-      "-c:v",
-      "libx264",
-      "-preset",
-      args.preset,
-      "-b:v",
-      args.video_bitrate,
-      "-maxrate",
-      args.video_bitrate,
-      "-bufsize",
-      args.buffer_size,
-      "-pix_fmt",
-      "yuv420p",
-      "-g",
-      "60",
-      "-c:a",
-      "aac",
-      "-b:a",
-      args.audio_bitrate,
-      "-ar",
-      "44100",
-      "-f",
-      "flv",
-      target,
-    ]
-  )
-
+  codec_mode = "transcode"
+  if getattr(args, "copy_codecs", False):
+    vcodec, acodec = _probe_codecs(input_value)
+    if vcodec == "h264" and acodec == "aac":
+      codec_mode = "copy"
+
+  def build_cmd(enc: str) -> list[str]:
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "warning"]
+    if args.loop:
+      cmd.extend(["-stream_loop", "-1"])
+    cmd.extend(["-re", "-i", input_value])
+    if enc == "copy":
+      cmd.extend(["-c:v", "copy", "-c:a", "copy", "-f", "flv", target])
+    else:
+      cmd.extend(_video_encode_args(enc, args))
+      cmd.extend(["-c:a", "aac", "-b:a", args.audio_bitrate, "-ar", "44100", "-f", "flv", target])
+    return cmd
+
+  def launch(cmd: list[str]) -> subprocess.Popen:
+    log_file = open(log_path, "a", encoding="utf-8")
+    try:
+      return subprocess.Popen(cmd, stdout=log_file, stderr=log_file, start_new_session=True)
+    except Exception as err:
+      raise CliError(f"Failed to launch ffmpeg: {err}") from err
+    finally:
+      log_file.close()
+
+  encoder = "copy" if codec_mode == "copy" else _resolve_encoder(getattr(args, "encoder", "auto"))
+  cmd = build_cmd(encoder)
   log_path = _stream_log_file()
-  log_file = open(log_path, "a", encoding="utf-8")
-  try:
-    proc = subprocess.Popen(cmd, stdout=log_file, stderr=log_file, start_new_session=True)
-  except Exception as err:
-    log_file.close()
-    raise CliError(f"Failed to launch ffmpeg: {err}") from err
-  log_file.close()
-
+  proc = launch(cmd)
   time.sleep(2.0)
   if proc.poll() is not None:
-    raise CliError(f"ffmpeg exited immediately with code {proc.returncode}. See {log_path}")
+    if getattr(args, "encoder", "auto") == "auto" and encoder in _HW_ENCODER_CODECS:
+      # The auto-picked hardware encoder has no usable device after all;
+      # fall back to software before giving up.
+      encoder = "x264"
+      cmd = build_cmd(encoder)
+      proc = launch(cmd)
+      time.sleep(2.0)
+    if proc.poll() is not None:
+      raise CliError(f"ffmpeg exited immediately with code {proc.returncode}. See {log_path}")
 
   _stream_pid_file().write_text(str(proc.pid), encoding="utf-8")
   meta = {
@@ -1600,9 +2177,11 @@ def _run_stream_start(args: argparse.Namespace) -> dict[str, Any]:
     "started_at": int(time.time()),
     "input": input_value,
     "target": target,
+    "encoder": encoder,
+    "codec_mode": codec_mode,
     "command": cmd,
   }
-  _stream_meta_file().write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+  _write_json_atomic(_stream_meta_file(), meta)
   return {
     "started": True,
     "pid": proc.pid,
@@ -1623,8 +2202,11 @@ def _run_stream_stop(args: argparse.Namespace) -> dict[str, Any]:
     return {"stopped": False, "message": "No running stream process found."}
 
   os.kill(pid, signal.SIGTERM)
-  deadline = time.time() + 8.0
-  while time.time() < deadline:
+  # ffmpeg is detached at spawn (not our child), so waitpid is unavailable;
+  # poll on the monotonic clock so a wall-clock jump cannot stretch or cut
+  # the grace period.
+  deadline = time.monotonic() + 8.0
+  while time.monotonic() < deadline:
     if not _pid_running(pid):
       break
     time.sleep(0.25)
@@ -1636,6 +2218,51 @@ def _run_stream_stop(args: argparse.Namespace) -> dict[str, Any]:
   return {"stopped": True, "pid": pid, "log_file": str(_stream_log_file())}
 
 
+def _tweets_from_search_payload(payload: Any) -> list[dict[str, Any]]:
+  """Pull tweet rows out of a captured SearchTimeline GraphQL payload.
+
+  Walks the nested instruction/entry structure generically so timeline layout
+  shuffles do not break capture; rows are shaped like the DOM extractor's.
+  """
+  rows: list[dict[str, Any]] = []
+
+  def walk(node: Any) -> None:
+    if isinstance(node, dict):
+      legacy = node.get("legacy")
+      rest_id = node.get("rest_id")
+      if isinstance(legacy, dict) and rest_id and "full_text" in legacy:
+        core = node.get("core") or {}
+        user = ((core.get("user_results") or {}).get("result") or {}).get("legacy") or {}
+        author = user.get("screen_name")
+        media = (legacy.get("entities") or {}).get("media") or []
+        image_urls = [m.get("media_url_https") for m in media if m.get("type") == "photo" and m.get("media_url_https")]
+        tweet_id = str(rest_id)
+        rows.append({
+          "key": tweet_id,
+          "tweet_id": tweet_id,
+          "text": (legacy.get("full_text") or "").strip(),
+          "author": author,
+          "url": f"https://x.com/{author}/status/{tweet_id}" if author else None,
+          "timestamp": legacy.get("created_at"),
+          "social_context": None,
+          "image_urls": image_urls,
+          "media_urls": image_urls,
+          "has_video": any(m.get("type") in ("video", "animated_gif") for m in media),
+          "has_media": bool(media),
+          "media_count": len(media),
+          "is_repost_hint": "retweeted_status_result" in legacy,
+        })
+        return
+      for value in node.values():
+        walk(value)
+    elif isinstance(node, list):
+      for item in node:
+        walk(item)
+
+  walk(payload)
+  return rows
+
+
 def _run_stream_live_search(args: argparse.Namespace) -> dict[str, Any]:
   query = (args.query or "").strip()
   if not query:
@@ -1643,32 +2270,79 @@ def _run_stream_live_search(args: argparse.Namespace) -> dict[str, Any]:
   duration = max(5, min(args.duration, 3600))
   interval = max(2, min(args.interval, 120))
   max_events = max(1, min(args.max_events, 1000))
-  encoded = urllib.parse.quote(query)
+  encoded = _qenc(query)
 
-  p, browser, context, page = _with_page(args)
-  try:
+  with _page_ctx(args) as page:
     _require_logged_in(page)
+    # Subscribe to the SearchTimeline XHRs the page issues itself; the loop
+    # then feeds on captured JSON instead of reloading and re-scraping DOM.
+    captured: list[Any] = []
+
+    def _on_response(response: Any) -> None:
+      if "SearchTimeline" in response.url:
+        captured.append(response)
+
+    page.on("response", _on_response)
     page.goto(f"https://x.com/search?q={encoded}&src=typed_query&f=live", wait_until="domcontentloaded")
-    page.wait_for_timeout(900)
+    # Pin the article locator once for the whole session; locators are lazy,
+    # so the same handle revalidates across reloads inside the loop.
+    first_article = _cached_locator(page, "article[data-testid='tweet']").first
+    try:
+      first_article.wait_for(state="visible", timeout=8000)
+    except Exception:
+      pass
     seen: set[str] = set()
     events: list[dict[str, Any]] = []
-    end_at = time.time() + duration
-    while time.time() < end_at and len(events) < max_events:
-      rows = _extract_tweets(page)
+    poll_interval = float(interval)
+    idle_cycles = 0
+    end_at = time.monotonic() + duration
+    while time.monotonic() < end_at and len(events) < max_events:
+      rows: list[dict[str, Any]] = []
+      while captured:
+        response = captured.pop(0)
+        try:
+          rows.extend(_tweets_from_search_payload(response.json()))
+        except Exception:
+          continue
+      if not rows:
+        rows = _extract_tweets(page, True)
+      fresh = 0
       for row in rows:
         tweet_id = str(row.get("tweet_id") or "")
         key = tweet_id or str(row.get("key") or "")
         if not key or key in seen:
           continue
         seen.add(key)
+        fresh += 1
         row["observed_at"] = int(time.time())
         events.append(row)
         if len(events) >= max_events:
           break
       if len(events) >= max_events:
         break
-      page.reload(wait_until="domcontentloaded")
-      page.wait_for_timeout(int(interval * 1000))
+      if fresh:
+        poll_interval = float(interval)
+        idle_cycles = 0
+      else:
+        # Adaptive backoff: quiet queries poll less, and only a persistently
+        # silent page pays for a full reload.
+        poll_interval = min(poll_interval * 2, 120.0)
+        idle_cycles += 1
+      if idle_cycles >= 3:
+        page.reload(wait_until="domcontentloaded")
+        idle_cycles = 0
+        try:
+          first_article.wait_for(state="visible", timeout=8000)
+        except Exception:
+          pass
+      else:
+        page.evaluate("() => { window.scrollBy(0, -200); window.scrollBy(0, 600); }")
+      remaining = end_at - time.monotonic()
+      if remaining <= 0:
+        break
+      # wait_for_timeout keeps pumping the event loop, so responses arriving
+      # during the pause are still captured.
+      page.wait_for_timeout(int(min(poll_interval, remaining) * 1000))
     return {
       "query": query,
       "duration": duration,
@@ -1676,20 +2350,235 @@ def _run_stream_live_search(args: argparse.Namespace) -> dict[str, Any]:
       "count": len(events),
       "events": events,
     }
+
+
+def _run_browserd(args: argparse.Namespace) -> dict[str, Any]:
+  """Keep one Chromium alive and let every other command attach over CDP.
+
+  Runs in the foreground until interrupted; _with_page discovers the endpoint
+  through the state file and skips its own browser launch while the daemon is
+  up, which removes the per-command Chromium cold start.
+  """
+  port = int(args.port)
+  p = _get_playwright()
+  launch_args = _CHROMIUM_LAUNCH_ARGS + [f"--remote-debugging-port={port}"]
+  browser = p.chromium.launch(headless=not args.visible, args=launch_args)
+  endpoint = f"http://127.0.0.1:{port}"
+  state_path = _browserd_state_file()
+  state_path.write_bytes(_dumpsb({"endpoint": endpoint, "pid": os.getpid(), "started_at": int(time.time())}))
+  signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+  try:
+    while True:
+      time.sleep(3600)
+  except KeyboardInterrupt:
+    pass
   finally:
-    context.close()
+    state_path.unlink(missing_ok=True)
     browser.close()
-    p.stop()
+  return {"stopped": True, "endpoint": endpoint}
+
+
+# Subparser signatures are declared as data: each spec is a tuple of
+# (flags, kwargs) entries fed straight to add_argument, so composing shared
+# argument groups is tuple concatenation instead of builder-function chaining
+# and the whole CLI surface is inspectable without executing anything.
+_ARG_USERNAME = (("--username", "--user-name"), {"dest": "username", "required": True})
+_ARG_LIMIT20 = (("--limit",), {"type": int, "default": 20})
+
+_SPEC_NONE: tuple = ()
+_SPEC_LOGIN = (
+  (("--username",), {"dest": "username", "default": None}),
+  (("--user-name",), {"dest": "user_name", "default": None}),
+  (("--password",), {"default": None}),
+  (("--email",), {"default": None}),
+  (("--refresh",), {"action": "store_true", "help": "Force credential refresh login flow."}),
+)
+_SPEC_REFRESH_LOGIN = _SPEC_LOGIN[:-1]
+_SPEC_ACCOUNT_DETAIL = (
+  (("--user-name",), {"dest": "user_name", "default": None}),
+  (("--username",), {"dest": "username", "default": None}),
+)
+_SPEC_TEXT = ((("--text",), {"required": True}),)
+_SPEC_TWEET_ID = ((("--tweet-id",), {"required": True}),)
+_SPEC_USERNAME = (_ARG_USERNAME,)
+_SPEC_DM = _SPEC_USERNAME + _SPEC_TEXT
+_SPEC_UPLOAD_MEDIA = (
+  (("--media-path",), {"required": True}),
+  (("--text",), {"default": ""}),
+)
+_SPEC_UPDATE_PROFILE = (
+  (("--name",), {"default": None}),
+  (("--bio",), {"default": None}),
+)
+_SPEC_FILE_PATH = ((("--file-path",), {"required": True}),)
+_SPEC_LIMIT20 = (_ARG_LIMIT20,)
+_SPEC_LIMIT40 = ((("--limit",), {"type": int, "default": 40}),)
+_SPEC_USER_LIST = _SPEC_USERNAME + _SPEC_LIMIT20
+_SPEC_KEYWORD_SEARCH = ((("--keyword",), {"required": True}),) + _SPEC_LIMIT20
+_SPEC_ADVANCED_SEARCH = (
+  (("--query",), {"required": True}),
+  (("--tab",), {"default": "latest"}),
+  _ARG_LIMIT20,
+)
+_SPEC_TWEET_IDS = (
+  (("--tweet-ids",), {"default": None, "help": "Comma-separated tweet ids."}),
+  (("--tweet-id",), {"action": "append", "default": []}),
+)
+_SPEC_TWEET_LIST = _SPEC_TWEET_ID + _SPEC_LIMIT20
+_SPEC_SPACE_ID = ((("--space-id",), {"required": True}),)
+_SPEC_STREAM_START = (
+  (("--input",), {"required": True, "help": "Input source for ffmpeg (file/device/url)."}),
+  (("--rtmp-url",), {"required": True, "help": "RTMP ingest base URL or full RTMP URL."}),
+  (("--stream-key",), {"default": None, "help": "Optional stream key appended to --rtmp-url."}),
+  (("--loop",), {"action": "store_true", "help": "Loop input continuously."}),
+  (("--preset",), {"default": "veryfast"}),
+  (
+    ("--copy-codecs",),
+    {"action": "store_true", "help": "Stream-copy instead of transcoding when the input is already H.264/AAC."},
+  ),
+  (
+    ("--encoder",),
+    {
+      "choices": ["auto", "x264", "nvenc", "vaapi", "videotoolbox"],
+      "default": "auto",
+      "help": "Video encoder; auto prefers a hardware encoder when ffmpeg has one.",
+    },
+  ),
+  (("--video-bitrate",), {"default": "4500k"}),
+  (("--audio-bitrate",), {"default": "128k"}),
+  (("--buffer-size",), {"default": "9000k"}),
+)
+_SPEC_BROWSERD = ((("--port",), {"type": int, "default": 9222, "help": "CDP port for the shared browser."}),)
+_SPEC_STREAM_LIVE = (
+  (("--query",), {"required": True}),
+  (("--duration",), {"type": int, "default": 120}),
+  (("--interval",), {"type": int, "default": 5}),
+  (("--max-events",), {"type": int, "default": 100}),
+)
+
+_SUBPARSER_SPECS: dict[str, tuple] = {
+  "user_login_v3": _SPEC_LOGIN,
+  "refresh_login_v3": _SPEC_REFRESH_LOGIN,
+  "get_my_x_account_detail_v3": _SPEC_ACCOUNT_DETAIL,
+  "send_tweet_v3": _SPEC_TEXT,
+  "create_tweet_v2": _SPEC_TEXT,
+  "like_tweet_v3": _SPEC_TWEET_ID,
+  "like_tweet_v2": _SPEC_TWEET_ID,
+  "unlike_tweet_v2": _SPEC_TWEET_ID,
+  "retweet_v3": _SPEC_TWEET_ID,
+  "retweet_tweet_v2": _SPEC_TWEET_ID,
+  "delete_tweet_v2": _SPEC_TWEET_ID,
+  "follow_user_v2": _SPEC_USERNAME,
+  "unfollow_user_v2": _SPEC_USERNAME,
+  "send_dm_to_user": _SPEC_DM,
+  "upload_media_v2": _SPEC_UPLOAD_MEDIA,
+  "update_profile_v3": _SPEC_UPDATE_PROFILE,
+  "update_profile_v2": _SPEC_UPDATE_PROFILE,
+  "update_avatar_v2": _SPEC_FILE_PATH,
+  "update_banner_v2": _SPEC_FILE_PATH,
+  "user_info": _SPEC_USERNAME,
+  "user_last_tweets": _SPEC_USER_LIST,
+  "user_last_tweet": _SPEC_USER_LIST,
+  "user_followers": _SPEC_USER_LIST,
+  "user_followings": _SPEC_USER_LIST,
+  "home_timeline": _SPEC_LIMIT40,
+  "notifications_list": _SPEC_LIMIT40,
+  "user_search": _SPEC_KEYWORD_SEARCH,
+  "search_user": _SPEC_KEYWORD_SEARCH,
+  "tweet_advanced_search": _SPEC_ADVANCED_SEARCH,
+  "advanced_search": _SPEC_ADVANCED_SEARCH,
+  "get_tweet_by_ids": _SPEC_TWEET_IDS,
+  "tweetById": _SPEC_TWEET_IDS,
+  "tweets": _SPEC_TWEET_IDS,
+  "tweet_replies": _SPEC_TWEET_LIST,
+  "tweet_quotes": _SPEC_TWEET_LIST,
+  "tweet_retweeters": _SPEC_TWEET_LIST,
+  "tweet_thread_context": _SPEC_TWEET_LIST,
+  "trends": _SPEC_LIMIT20,
+  "spaces_detail": _SPEC_SPACE_ID,
+  "spaces_live": _SPEC_LIMIT20,
+  "spaces_listen": _SPEC_SPACE_ID,
+  "stream_start": _SPEC_STREAM_START,
+  "stream_status": _SPEC_NONE,
+  "stream_stop": _SPEC_NONE,
+  "browserd": _SPEC_BROWSERD,
+  "stream_live_search": _SPEC_STREAM_LIVE,
+}
 
+# Non-argument parser defaults that a spec cannot express.
+_SUBPARSER_DEFAULTS: dict[str, dict[str, Any]] = {
+  "refresh_login_v3": {"refresh": True},
+}
+
+
+# Endpoints that share a spec object (and defaults) collapse into one argparse
+# parser with the rest of the group registered as aliases, so a full build
+# constructs one parser per distinct signature instead of one per name.
+# argparse records the typed alias in args.endpoint, so dispatch is unaffected.
+def _grouped_subparsers() -> list[tuple[str, list[str]]]:
+  groups: dict[tuple[int, tuple], list[str]] = {}
+  for name, spec in _SUBPARSER_SPECS.items():
+    key = (id(spec), tuple(sorted(_SUBPARSER_DEFAULTS.get(name, {}).items())))
+    groups.setdefault(key, []).append(name)
+  return [(names[0], names[1:]) for names in groups.values()]
+
+
+_SUBPARSER_GROUPS = _grouped_subparsers()
+
+
+def _configure_subparser(p: argparse.ArgumentParser, name: str) -> None:
+  for flags, kwargs in _SUBPARSER_SPECS[name]:
+    p.add_argument(*flags, **kwargs)
+  defaults = _SUBPARSER_DEFAULTS.get(name)
+  if defaults:
+    p.set_defaults(**defaults)
+
+
+# Global options that consume the next argv token; their values must not be
+# mistaken for the endpoint (e.g. --chrome-profile-name trends).
+_GLOBAL_VALUE_FLAGS = frozenset({
+  "--browser",
+  "--chrome-profile",
+  "--chrome-profile-name",
+  "--notify-webhook",
+  "--compat-provider",
+})
+
+
+def _requested_endpoint() -> str | None:
+  """First argv token that names an endpoint, or None (full build)."""
+  tokens = iter(sys.argv[1:])
+  for token in tokens:
+    if token in _GLOBAL_VALUE_FLAGS:
+      next(tokens, None)
+      continue
+    if token in _SUBPARSER_SPECS:
+      return token
+  return None
 
-def _build_parser() -> argparse.ArgumentParser:
+
+@functools.cache
+def _build_parser(endpoint: str | None = None) -> argparse.ArgumentParser:
+  """Compiled parser, cached per endpoint for in-process reuse.
+
+  One-shot CLI runs build one parser; scripts that import the module and call
+  main() in a loop get the compiled parser back on every repeat invocation,
+  keyed by endpoint so lazily-built variants don't collide with each other or
+  with the full fallback build.
+  """
   parser = argparse.ArgumentParser(description="Local X API parity CLI (no external API keys).")
-  parser.add_argument("--browser", choices=sorted(VALID_BROWSERS), default="chrome")
+  parser.add_argument("--browser", choices=_BROWSER_CHOICES, default="chrome")
   parser.add_argument("--chrome-profile", default=None, help="Path to browser profile root or Cookies DB.")
   parser.add_argument("--chrome-profile-name", default="Default", help="Profile name when --chrome-profile is a user data root.")
   parser.add_argument("--visible", action="store_true", help="Run browser in visible mode.")
+  parser.add_argument("--fresh", action="store_true", help="Use an isolated browser context instead of the warm in-process one.")
   parser.add_argument("--notify", action="store_true", help="Send local desktop notification after command.")
   parser.add_argument("--notify-webhook", default=None, help="Webhook URL for JSON push notifications.")
+  parser.add_argument(
+    "--notify-batch",
+    action="store_true",
+    help="Queue webhook notifications and deliver them in one request at exit.",
+  )
   parser.add_argument(
     "--compat-provider",
     choices=["none", "aisa"],
@@ -1698,234 +2587,125 @@ def _build_parser() -> argparse.ArgumentParser:
   )
 
   sub = parser.add_subparsers(dest="endpoint", required=True)
-
-  login = sub.add_parser("user_login_v3")
-  login.add_argument("--username", dest="username", default=None)
-  login.add_argument("--user-name", dest="user_name", default=None)
-  login.add_argument("--password", default=None)
-  login.add_argument("--email", default=None)
-  login.add_argument("--refresh", action="store_true", help="Force credential refresh login flow.")
-
-  refresh_login = sub.add_parser("refresh_login_v3")
-  refresh_login.add_argument("--username", dest="username", default=None)
-  refresh_login.add_argument("--user-name", dest="user_name", default=None)
-  refresh_login.add_argument("--password", default=None)
-  refresh_login.add_argument("--email", default=None)
-  refresh_login.set_defaults(refresh=True)
-
-  detail = sub.add_parser("get_my_x_account_detail_v3")
-  detail.add_argument("--user-name", dest="user_name", default=None)
-  detail.add_argument("--username", dest="username", default=None)
-
-  for name in ("send_tweet_v3", "create_tweet_v2"):
-    cmd = sub.add_parser(name)
-    cmd.add_argument("--text", required=True)
-
-  for name in ("like_tweet_v3", "like_tweet_v2", "unlike_tweet_v2", "retweet_v3", "retweet_tweet_v2", "delete_tweet_v2"):
-    cmd = sub.add_parser(name)
-    cmd.add_argument("--tweet-id", required=True)
-
-  for name in ("follow_user_v2", "unfollow_user_v2"):
-    cmd = sub.add_parser(name)
-    cmd.add_argument("--username", "--user-name", dest="username", required=True)
-
-  dm = sub.add_parser("send_dm_to_user")
-  dm.add_argument("--username", "--user-name", dest="username", required=True)
-  dm.add_argument("--text", required=True)
-
-  media = sub.add_parser("upload_media_v2")
-  media.add_argument("--media-path", required=True)
-  media.add_argument("--text", default="")
-
-  for name in ("update_profile_v3", "update_profile_v2"):
-    up = sub.add_parser(name)
-    up.add_argument("--name", default=None)
-    up.add_argument("--bio", default=None)
-
-  for name in ("update_avatar_v2", "update_banner_v2"):
-    upm = sub.add_parser(name)
-    upm.add_argument("--file-path", required=True)
-
-  info = sub.add_parser("user_info")
-  info.add_argument("--username", "--user-name", dest="username", required=True)
-
-  for name in ("user_last_tweets", "user_last_tweet", "user_followers", "user_followings"):
-    cmd = sub.add_parser(name)
-    cmd.add_argument("--username", "--user-name", dest="username", required=True)
-    cmd.add_argument("--limit", type=int, default=20)
-
-  home_timeline = sub.add_parser("home_timeline")
-  home_timeline.add_argument("--limit", type=int, default=40)
-
-  notifications = sub.add_parser("notifications_list")
-  notifications.add_argument("--limit", type=int, default=40)
-
-  for name in ("user_search", "search_user"):
-    cmd = sub.add_parser(name)
-    cmd.add_argument("--keyword", required=True)
-    cmd.add_argument("--limit", type=int, default=20)
-
-  for name in ("tweet_advanced_search", "advanced_search"):
-    cmd = sub.add_parser(name)
-    cmd.add_argument("--query", required=True)
-    cmd.add_argument("--tab", default="latest")
-    cmd.add_argument("--limit", type=int, default=20)
-
-  for name in ("get_tweet_by_ids", "tweetById", "tweets"):
-    cmd = sub.add_parser(name)
-    cmd.add_argument("--tweet-ids", default=None, help="Comma-separated tweet ids.")
-    cmd.add_argument("--tweet-id", action="append", default=[])
-
-  for name in ("tweet_replies", "tweet_quotes", "tweet_retweeters", "tweet_thread_context"):
-    cmd = sub.add_parser(name)
-    cmd.add_argument("--tweet-id", required=True)
-    cmd.add_argument("--limit", type=int, default=20)
-
-  trends = sub.add_parser("trends")
-  trends.add_argument("--limit", type=int, default=20)
-
-  spaces_detail = sub.add_parser("spaces_detail")
-  spaces_detail.add_argument("--space-id", required=True)
-
-  spaces_live = sub.add_parser("spaces_live")
-  spaces_live.add_argument("--limit", type=int, default=20)
-
-  spaces_listen = sub.add_parser("spaces_listen")
-  spaces_listen.add_argument("--space-id", required=True)
-
-  stream_start = sub.add_parser("stream_start")
-  stream_start.add_argument("--input", required=True, help="Input source for ffmpeg (file/device/url).")
-  stream_start.add_argument("--rtmp-url", required=True, help="RTMP ingest base URL or full RTMP URL.")
-  stream_start.add_argument("--stream-key", default=None, help="Optional stream key appended to --rtmp-url.")
-  stream_start.add_argument("--loop", action="store_true", help="Loop input continuously.")
-  stream_start.add_argument("--preset", default="veryfast")
-  stream_start.add_argument("--video-bitrate", default="4500k")
-  stream_start.add_argument("--audio-bitrate", default="128k")
-  stream_start.add_argument("--buffer-size", default="9000k")
-
-  sub.add_parser("stream_status")
-  sub.add_parser("stream_stop")
-
-  stream_live = sub.add_parser("stream_live_search")
-  stream_live.add_argument("--query", required=True)
-  stream_live.add_argument("--duration", type=int, default=120)
-  stream_live.add_argument("--interval", type=int, default=5)
-  stream_live.add_argument("--max-events", type=int, default=100)
+  # When the target endpoint is known, only its subparser gets arguments; the
+  # rest are added as bare stubs so top-level help still lists every command.
+  for name, aliases in _SUBPARSER_GROUPS:
+    cmd = sub.add_parser(name, aliases=aliases)
+    if endpoint is None or endpoint == name or endpoint in aliases:
+      _configure_subparser(cmd, name)
 
   return parser
 
 
+def _run_refresh_login_v3(args: argparse.Namespace) -> dict[str, Any]:
+  args.refresh = True
+  return _run_user_login_v3(args)
+
+
+_DISPATCH: dict[str, Any] = {
+  "user_login_v3": _run_user_login_v3,
+  "refresh_login_v3": _run_refresh_login_v3,
+  "get_my_x_account_detail_v3": _run_get_my_x_account_detail_v3,
+  "send_tweet_v3": _run_send_tweet_v3,
+  "create_tweet_v2": _run_create_tweet_v2,
+  "like_tweet_v3": _run_like_tweet_v3,
+  "like_tweet_v2": _run_like_tweet_v3,
+  "unlike_tweet_v2": _run_unlike_tweet_v2,
+  "retweet_v3": _run_retweet_v3,
+  "retweet_tweet_v2": _run_retweet_v3,
+  "delete_tweet_v2": _run_delete_tweet_v2,
+  "follow_user_v2": _run_follow_user_v2,
+  "unfollow_user_v2": _run_unfollow_user_v2,
+  "send_dm_to_user": _run_send_dm_to_user,
+  "upload_media_v2": _run_upload_media_v2,
+  "update_profile_v3": _run_update_profile_v3,
+  "update_profile_v2": _run_update_profile_v3,
+  "update_avatar_v2": functools.partial(_run_update_media_profile, mode="avatar"),
+  "update_banner_v2": functools.partial(_run_update_media_profile, mode="banner"),
+  "user_info": _run_user_info,
+  "user_last_tweets": _run_user_last_tweets,
+  "user_last_tweet": _run_user_last_tweets,
+  "home_timeline": _run_home_timeline,
+  "notifications_list": _run_notifications_list,
+  "user_followers": functools.partial(_run_user_connections, mode="followers"),
+  "user_followings": functools.partial(_run_user_connections, mode="followings"),
+  "user_search": _run_search_user,
+  "search_user": _run_search_user,
+  "tweet_advanced_search": _run_advanced_search,
+  "advanced_search": _run_advanced_search,
+  "get_tweet_by_ids": _run_get_tweet_by_ids,
+  "tweetById": _run_get_tweet_by_ids,
+  "tweets": _run_get_tweet_by_ids,
+  "tweet_replies": _run_tweet_replies,
+  "tweet_quotes": _run_tweet_quotes,
+  "tweet_retweeters": _run_tweet_retweeters,
+  "tweet_thread_context": _run_tweet_thread_context,
+  "trends": _run_trends,
+  "spaces_detail": _run_spaces_detail,
+  "spaces_live": _run_spaces_live,
+  "spaces_listen": _run_spaces_listen,
+  "stream_start": _run_stream_start,
+  "stream_status": _run_stream_status,
+  "stream_stop": _run_stream_stop,
+  "stream_live_search": _run_stream_live_search,
+  "browserd": _run_browserd,
+}
+# argparse hands back endpoint strings that are not compile-time interned;
+# interning both sides lets the dict probe hit the pointer-equality fast path.
+_DISPATCH = {sys.intern(key): handler for key, handler in _DISPATCH.items()}
+# Operators can pin their dominant endpoint so dispatch is a single identity
+# check before the hash probe (PGO-style top-1 specialization).
+_HOT_ENDPOINT = sys.intern(os.environ.get("X_V3_HOT_ENDPOINT", "home_timeline"))
+_HOT_HANDLER = _DISPATCH.get(_HOT_ENDPOINT)
+
+
 def _dispatch(args: argparse.Namespace) -> dict[str, Any]:
-  endpoint = args.endpoint
-  if endpoint in {"user_login_v3", "refresh_login_v3"}:
-    if endpoint == "refresh_login_v3":
-      args.refresh = True
-    return _run_user_login_v3(args)
-  if endpoint == "get_my_x_account_detail_v3":
-    return _run_get_my_x_account_detail_v3(args)
-  if endpoint in {"send_tweet_v3", "create_tweet_v2"}:
-    return _run_send_tweet_v3(args) if endpoint == "send_tweet_v3" else _run_create_tweet_v2(args)
-  if endpoint in {"like_tweet_v3", "like_tweet_v2"}:
-    return _run_like_tweet_v3(args)
-  if endpoint == "unlike_tweet_v2":
-    return _run_unlike_tweet_v2(args)
-  if endpoint in {"retweet_v3", "retweet_tweet_v2"}:
-    return _run_retweet_v3(args)
-  if endpoint == "delete_tweet_v2":
-    return _run_delete_tweet_v2(args)
-  if endpoint == "follow_user_v2":
-    return _run_follow_user_v2(args)
-  if endpoint == "unfollow_user_v2":
-    return _run_unfollow_user_v2(args)
-  if endpoint == "send_dm_to_user":
-    return _run_send_dm_to_user(args)
-  if endpoint == "upload_media_v2":
-    return _run_upload_media_v2(args)
-  if endpoint in {"update_profile_v3", "update_profile_v2"}:
-    return _run_update_profile_v3(args)
-  if endpoint == "update_avatar_v2":
-    return _run_update_media_profile(args, "avatar")
-  if endpoint == "update_banner_v2":
-    return _run_update_media_profile(args, "banner")
-  if endpoint == "user_info":
-    return _run_user_info(args)
-  if endpoint in {"user_last_tweets", "user_last_tweet"}:
-    return _run_user_last_tweets(args)
-  if endpoint == "home_timeline":
-    return _run_home_timeline(args)
-  if endpoint == "notifications_list":
-    return _run_notifications_list(args)
-  if endpoint == "user_followers":
-    return _run_user_connections(args, "followers")
-  if endpoint == "user_followings":
-    return _run_user_connections(args, "followings")
-  if endpoint in {"user_search", "search_user"}:
-    return _run_search_user(args)
-  if endpoint in {"tweet_advanced_search", "advanced_search"}:
-    return _run_advanced_search(args)
-  if endpoint in {"get_tweet_by_ids", "tweetById", "tweets"}:
-    return _run_get_tweet_by_ids(args)
-  if endpoint == "tweet_replies":
-    return _run_tweet_replies(args)
-  if endpoint == "tweet_quotes":
-    return _run_tweet_quotes(args)
-  if endpoint == "tweet_retweeters":
-    return _run_tweet_retweeters(args)
-  if endpoint == "tweet_thread_context":
-    return _run_tweet_thread_context(args)
-  if endpoint == "trends":
-    return _run_trends(args)
-  if endpoint == "spaces_detail":
-    return _run_spaces_detail(args)
-  if endpoint == "spaces_live":
-    return _run_spaces_live(args)
-  if endpoint == "spaces_listen":
-    return _run_spaces_listen(args)
-  if endpoint == "stream_start":
-    return _run_stream_start(args)
-  if endpoint == "stream_status":
-    return _run_stream_status(args)
-  if endpoint == "stream_stop":
-    return _run_stream_stop(args)
-  if endpoint == "stream_live_search":
-    return _run_stream_live_search(args)
-  raise CliError(f"Unsupported endpoint command: {endpoint}")
+  endpoint = sys.intern(args.endpoint)
+  if endpoint is _HOT_ENDPOINT and _HOT_HANDLER is not None:
+    return _HOT_HANDLER(args)
+  handler = _DISPATCH.get(endpoint)
+  if handler is None:
+    raise CliError(f"Unsupported endpoint command: {endpoint}")
+  return handler(args)
+
+
+# (exception class, exit code, error message template, notify template);
+# anything unmatched reports as an unexpected failure with exit code 4.
+_ERROR_TABLE: tuple[tuple[type, int, str, str], ...] = (
+  (CliError, 2, "{err}", "{err}"),
+  (
+    urllib.error.URLError,
+    3,
+    "Network error while sending notification webhook: {err}",
+    "notification webhook network error",
+  ),
+)
 
 
 def main() -> int:
-  parser = _build_parser()
+  parser = _build_parser(_requested_endpoint())
   args = parser.parse_args()
+  endpoint = args.endpoint
   try:
     data = _dispatch(args)
-    result = CommandResult(ok=True, endpoint=args.endpoint, data=data)
-    print(_render_output(result, args))
-    _notify(args, True, args.endpoint, "completed")
+    result = CommandResult(ok=True, endpoint=endpoint, data=data)
+    # One write() with the trailing newline pre-joined: a single syscall, and
+    # the payload is flushed before _notify can stall on webhook latency.
+    sys.stdout.write(_render_output(result, args) + "\n")
+    sys.stdout.flush()
+    _notify(args, True, endpoint, "completed")
     return 0
-  except CliError as err:
-    result = CommandResult(ok=False, endpoint=args.endpoint, data={}, error=str(err))
-    print(_render_output(result, args), file=sys.stderr)
-    _notify(args, False, args.endpoint, str(err))
-    return 2
-  except urllib.error.URLError as err:
-    result = CommandResult(
-      ok=False,
-      endpoint=args.endpoint,
-      data={},
-      error=f"Network error while sending notification webhook: {err}",
-    )
-    print(_render_output(result, args), file=sys.stderr)
-    _notify(args, False, args.endpoint, "notification webhook network error")
-    return 3
   except Exception as err:
-    result = CommandResult(
-      ok=False,
-      endpoint=args.endpoint,
-      data={},
-      error=f"Unexpected failure: {err}",
-    )
-    print(_render_output(result, args), file=sys.stderr)
-    _notify(args, False, args.endpoint, "unexpected failure")
-    return 4
+    for cls, code, error_tmpl, notify_tmpl in _ERROR_TABLE:
+      if isinstance(err, cls):
+        break
+    else:
+      code, error_tmpl, notify_tmpl = 4, "Unexpected failure: {err}", "unexpected failure"
+    result = CommandResult(ok=False, endpoint=endpoint, data={}, error=error_tmpl.format(err=err))
+    sys.stderr.write(_render_output(result, args) + "\n")
+    sys.stderr.flush()
+    _notify(args, False, endpoint, notify_tmpl.format(err=err))
+    return code
 
 
 if __name__ == "__main__":